@@ -0,0 +1,18 @@
+"""Timestamp formatting shared by the evaluator and the decision engine."""
+from __future__ import annotations
+
+import time
+from typing import Tuple
+
+# One-entry cache: calls within the same second share one formatted string.
+_last_iso: Tuple[int, str] = (-1, "")
+
+
+def iso_timestamp(now: float) -> str:
+    """Format epoch seconds as ``YYYY-MM-DDTHH:MM:SSZ`` (UTC, truncated to the second)."""
+    global _last_iso
+    second = int(now)
+    cached = _last_iso
+    if cached[0] != second:
+        cached = _last_iso = (second, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second)))
+    return cached[1]
@@ -0,0 +1,18 @@
+"""Digest helpers shared by the evaluator and the anomaly model."""
+from __future__ import annotations
+
+import hashlib
+from typing import Iterable
+
+
+def hash_paths(paths: Iterable[str]) -> str:
+    """128-bit BLAKE2b hex digest of ``"|".join(sorted(paths))``, computed without building the joined string."""
+    digest = hashlib.blake2b(digest_size=16)
+    update = digest.update
+    first = True
+    for path in sorted(paths):
+        if not first:
+            update(b"|")
+        update(path.encode("utf-8"))
+        first = False
+    return digest.hexdigest()
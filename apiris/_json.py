@@ -0,0 +1,65 @@
+"""JSON helpers that use orjson when it is installed, stdlib json otherwise.
+
+Both backends produce the same text: compact separators, UTF-8 output
+rather than ``\\uXXXX`` escapes, and ``null`` for NaN/Infinity.
+"""
+from __future__ import annotations
+
+import json
+import math
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional dependency: pip install "apiris[fast]"
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch this regardless of which backend is active.
+JSONDecodeError = json.JSONDecodeError
+
+_SEPARATORS = (",", ":")
+
+
+def _finite(obj: Any) -> Any:
+    """Return ``obj`` with non-finite floats replaced by None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def _stdlib_dumps(obj: Any) -> str:
+    try:
+        return json.dumps(obj, separators=_SEPARATORS, ensure_ascii=False, allow_nan=False)
+    except ValueError as exc:
+        if not str(exc).startswith("Out of range float"):
+            raise
+        return json.dumps(_finite(obj), separators=_SEPARATORS, ensure_ascii=False, allow_nan=False)
+
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 JSON bytes."""
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson rejects non-str keys and >64-bit ints; stdlib json does not.
+            return _stdlib_dumps(obj).encode("utf-8")
+
+    def dumps(obj: Any) -> str:
+        """Serialize ``obj`` to a compact JSON string."""
+        return dumps_bytes(obj).decode("utf-8")
+else:
+    loads = json.loads
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 JSON bytes."""
+        return _stdlib_dumps(obj).encode("utf-8")
+
+    dumps = _stdlib_dumps
@@ -0,0 +1,10 @@
+"""Sensitive key names shared by the masking and exposure checks."""
+from __future__ import annotations
+
+import re
+
+# Substrings that mark a payload key as sensitive.
+SENSITIVE_KEY_PATTERNS = ("password", "secret", "token", "api_key", "api-key", "auth", "cookie", "session", "jwt")
+
+# Matches a key (or any text) containing one of the patterns, in any case.
+SENSITIVE_KEY_RE = re.compile("|".join(map(re.escape, SENSITIVE_KEY_PATTERNS)), re.IGNORECASE)
@@ -1,158 +1,345 @@
 from __future__ import annotations
 
+import functools
 import hashlib
+import heapq
 import math
-from typing import Any, Dict, List, Optional
+import operator
+import sys
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
+from .._hashing import hash_paths
 from .loader import load_json
 
+_FEATURE_CACHE_SIZE = 128
+_FLAT_FOREST_CACHE_SIZE = 32
+_flat_forests: Dict[int, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+
 
 def _hash_text(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
-
-
-def _extract_schema_paths(value: Any, prefix: str = "", depth: int = 0, max_depth: int = 6, paths: Optional[set] = None) -> set:
-    if paths is None:
-        paths = set()
-    if depth > max_depth:
-        return paths
-    if isinstance(value, list):
-        array_prefix = f"{prefix}[]" if prefix else "[]"
-        paths.add(array_prefix)
-        if value:
-            _extract_schema_paths(value[0], array_prefix, depth + 1, max_depth, paths)
-        return paths
-    if isinstance(value, dict):
-        for key, val in value.items():
-            next_prefix = f"{prefix}.{key}" if prefix else str(key)
-            paths.add(next_prefix)
-            _extract_schema_paths(val, next_prefix, depth + 1, max_depth, paths)
-    return paths
-
-
-def _collect_stats(value: Any, depth: int = 0, stats: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    current = stats or {
-        "field_count": 0,
-        "max_depth": 0,
-        "array_count": 0,
-        "null_count": 0,
-        "value_count": 0,
-        "numeric_values": [],
+    # Only used for equality checks (schema/response change detection),
+    # so a 128-bit BLAKE2b digest is plenty and cheaper than SHA-256.
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _walk_payload(value: Any, max_path_depth: int = 6) -> Dict[str, Any]:
+    """Collect schema paths and structural/numeric stats in one traversal.
+
+    Stats cover every node. Schema paths follow only the first element of
+    each list and stop below ``max_path_depth``; nodes off that track are
+    pushed with a ``None`` prefix.
+    """
+    paths: set = set()
+    field_count = 0
+    max_depth = 0
+    array_count = 0
+    null_count = 0
+    value_count = 0
+    numeric_count = 0
+    numeric_mean = 0.0
+    numeric_m2 = 0.0
+    numeric_min = math.inf
+    numeric_max = -math.inf
+
+    stack: List[Tuple[Any, int, Optional[str]]] = [(value, 0, "")]
+    while stack:
+        node, depth, prefix = stack.pop()
+        if prefix is not None and depth > max_path_depth:
+            prefix = None
+        if isinstance(node, list):
+            array_count += 1
+            if depth > max_depth:
+                max_depth = depth
+            child_prefix = None
+            if prefix is not None:
+                child_prefix = prefix + "[]" if prefix else "[]"
+                paths.add(child_prefix)
+            for idx in range(len(node) - 1, -1, -1):
+                stack.append((node[idx], depth + 1, child_prefix if idx == 0 else None))
+        elif isinstance(node, dict):
+            if depth > max_depth:
+                max_depth = depth
+            field_count += len(node)
+            for key, val in reversed(node.items()):
+                next_prefix = None
+                if prefix is not None:
+                    # Keys repeat across payloads, so intern the segment
+                    # itself; the joined path is built from interned parts.
+                    name = sys.intern(key if type(key) is str else str(key))
+                    next_prefix = prefix + "." + name if prefix else name
+                    paths.add(next_prefix)
+                stack.append((val, depth + 1, next_prefix))
+        else:
+            value_count += 1
+            if node is None:
+                null_count += 1
+            elif isinstance(node, (int, float)) and math.isfinite(node):
+                # Welford's online update keeps mean/variance in a single
+                # pass without materializing every numeric value.
+                number = float(node)
+                numeric_count += 1
+                delta = number - numeric_mean
+                numeric_mean += delta / numeric_count
+                numeric_m2 += delta * (number - numeric_mean)
+                if number < numeric_min:
+                    numeric_min = number
+                if number > numeric_max:
+                    numeric_max = number
+
+    return {
+        "paths": paths,
+        "field_count": field_count,
+        "max_depth": max_depth,
+        "array_count": array_count,
+        "null_count": null_count,
+        "value_count": value_count,
+        "numeric_count": numeric_count,
+        "numeric_mean": numeric_mean,
+        "numeric_m2": numeric_m2,
+        "numeric_min": numeric_min,
+        "numeric_max": numeric_max,
     }
-    if isinstance(value, list):
-        current["array_count"] += 1
-        current["max_depth"] = max(current["max_depth"], depth)
-        for item in value:
-            _collect_stats(item, depth + 1, current)
-        return current
-    if isinstance(value, dict):
-        current["max_depth"] = max(current["max_depth"], depth)
-        for _, val in value.items():
-            current["field_count"] += 1
-            _collect_stats(val, depth + 1, current)
-        return current
-
-    current["value_count"] += 1
-    if value is None:
-        current["null_count"] += 1
-    if isinstance(value, (int, float)) and math.isfinite(value):
-        current["numeric_values"].append(float(value))
-    return current
-
-
-def _numeric_stats(values: List[float]) -> Dict[str, float]:
-    if not values:
+
+
+def _numeric_stats(stats: Dict[str, Any]) -> Dict[str, float]:
+    count = stats["numeric_count"]
+    if not count:
         return {"mean": 0.0, "std": 0.0, "min": 0.0, "max": 0.0}
-    mean = sum(values) / len(values)
-    variance = sum((v - mean) ** 2 for v in values) / len(values)
     return {
-        "mean": mean,
-        "std": math.sqrt(variance),
-        "min": min(values),
-        "max": max(values),
+        "mean": stats["numeric_mean"],
+        "std": math.sqrt(stats["numeric_m2"] / count),
+        "min": stats["numeric_min"],
+        "max": stats["numeric_max"],
     }
 
 
-def _compute_feature_vector(parsed: Any, context: Dict[str, Any]) -> Dict[str, Any]:
-    schema_paths = sorted(_extract_schema_paths(parsed)) if parsed is not None else []
-    schema_hash = _hash_text("|".join(schema_paths)) if schema_paths else None
-    stats = _collect_stats(parsed)
-    numeric = _numeric_stats(stats["numeric_values"])
+def _compute_payload_features(parsed: Any, core_fields: FrozenSet[str]) -> Dict[str, Any]:
+    """Features that depend only on the payload, not on per-API runtime state."""
+    stats = _walk_payload(parsed)
+    paths = stats["paths"]
+    schema_hash = hash_paths(paths) if paths else None
+    numeric = _numeric_stats(stats)
 
-    core_fields = context.get("core_fields") or []
-    missing_core = 0
-    if core_fields and schema_paths:
-        path_set = set(schema_paths)
-        for field in core_fields:
-            if field not in path_set:
-                missing_core += 1
+    missing_core = len(core_fields - paths) if core_fields and paths else 0
 
+    return {
+        "schemaHash": schema_hash,
+        "field_count": stats["field_count"],
+        "max_depth": stats["max_depth"],
+        "array_count": stats["array_count"],
+        "null_ratio": (stats["null_count"] / stats["value_count"]) if stats["value_count"] else 0,
+        "numeric_mean": numeric["mean"],
+        "numeric_std": numeric["std"],
+        "numeric_min": numeric["min"],
+        "numeric_max": numeric["max"],
+        "missing_core_ratio": (missing_core / len(core_fields)) if core_fields else 0,
+    }
+
+
+def _compute_feature_vector(payload: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     response_hash = context.get("response_hash")
-    previous_hash = context.get("last_response_hash")
-    repeat_count = (context.get("repeat_count") or 0) + 1 if previous_hash and response_hash == previous_hash else 0
+    repeat_count = context.get("repeat_count") or 0
     time_since_last = -1
-    if response_hash and context.get("last_response_timestamp") and response_hash == previous_hash:
+    if repeat_count and context.get("last_response_timestamp"):
         time_since_last = (context.get("now") - context.get("last_response_timestamp")) / 1000
 
     numeric_jump = 0
     if context.get("last_numeric_mean") is not None:
-        numeric_jump = abs(numeric["mean"] - context.get("last_numeric_mean"))
+        numeric_jump = abs(payload["numeric_mean"] - context.get("last_numeric_mean"))
 
     return {
-        "schemaHash": schema_hash,
+        "schemaHash": payload["schemaHash"],
         "responseHash": response_hash,
         "featureMap": {
-            "field_count": stats["field_count"],
-            "max_depth": stats["max_depth"],
-            "array_count": stats["array_count"],
-            "null_ratio": (stats["null_count"] / stats["value_count"]) if stats["value_count"] else 0,
-            "numeric_mean": numeric["mean"],
-            "numeric_std": numeric["std"],
-            "numeric_min": numeric["min"],
-            "numeric_max": numeric["max"],
+            "field_count": payload["field_count"],
+            "max_depth": payload["max_depth"],
+            "array_count": payload["array_count"],
+            "null_ratio": payload["null_ratio"],
+            "numeric_mean": payload["numeric_mean"],
+            "numeric_std": payload["numeric_std"],
+            "numeric_min": payload["numeric_min"],
+            "numeric_max": payload["numeric_max"],
             "numeric_jump": numeric_jump,
-            "missing_core_ratio": (missing_core / len(core_fields)) if core_fields else 0,
+            "missing_core_ratio": payload["missing_core_ratio"],
             "repeat_count": repeat_count,
             "time_since_identical": time_since_last,
         },
     }
 
 
+_FEATURE_KEYS = frozenset((
+    "field_count",
+    "max_depth",
+    "array_count",
+    "null_ratio",
+    "numeric_mean",
+    "numeric_std",
+    "numeric_min",
+    "numeric_max",
+    "numeric_jump",
+    "missing_core_ratio",
+    "repeat_count",
+    "time_since_identical",
+))
+
+
+def _row_extractor(feature_names: List[str]) -> Callable[[Dict[str, Any]], Sequence[Any]]:
+    """Build a featureMap -> row function specialized for ``feature_names``."""
+    if len(feature_names) > 1 and _FEATURE_KEYS.issuperset(feature_names):
+        # Every name is always present in the featureMap, so a single C-level
+        # itemgetter call replaces the per-name .get() loop.
+        return operator.itemgetter(*feature_names)
+    return lambda feature_map: [feature_map.get(name, 0) for name in feature_names]
+
+
 def _harmonic(n: int) -> float:
     return sum(1.0 / i for i in range(1, n + 1))
 
 
+@functools.lru_cache(maxsize=None)
 def _c_factor(n: int) -> float:
     if n <= 1:
         return 0.0
     return 2.0 * _harmonic(n - 1) - (2.0 * (n - 1)) / n
 
 
-def _path_length(row: List[float], node: Dict[str, Any], depth: int) -> float:
-    if node.get("leaf"):
-        return depth + _c_factor(node.get("size", 1))
-    feature = node.get("feature")
-    split = node.get("split")
-    if row[feature] <= split:
-        return _path_length(row, node.get("left"), depth + 1)
-    return _path_length(row, node.get("right"), depth + 1)
+def _flatten_forest(forest: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten nested tree dicts into parallel per-node arrays.
+
+    Node ``i`` of the forest is described by ``feature[i]``, ``split[i]``,
+    ``left[i]``/``right[i]`` (child indices) and ``leaf[i]``. For leaves,
+    ``pathlen[i]`` is the precomputed ``depth + c(size)`` path length;
+    ``roots`` holds the index of each tree's root node and ``norm`` is the
+    ``c(sampleSize)`` normalizer applied to the average path length.
+    """
+    feature: List[int] = []
+    split: List[float] = []
+    left: List[int] = []
+    right: List[int] = []
+    leaf: List[bool] = []
+    pathlen: List[float] = []
+    roots: List[int] = []
+    for tree in forest.get("trees", []):
+        pending = [(tree, 0, -1, False)]
+        while pending:
+            node, depth, parent, is_right = pending.pop()
+            idx = len(feature)
+            if parent < 0:
+                roots.append(idx)
+            elif is_right:
+                right[parent] = idx
+            else:
+                left[parent] = idx
+            is_leaf = bool(node.get("leaf"))
+            feature.append(-1 if is_leaf else node.get("feature"))
+            split.append(0.0 if is_leaf else node.get("split"))
+            left.append(-1)
+            right.append(-1)
+            leaf.append(is_leaf)
+            pathlen.append(depth + _c_factor(node.get("size", 1)) if is_leaf else 0.0)
+            if not is_leaf:
+                pending.append((node.get("right"), depth + 1, idx, True))
+                pending.append((node.get("left"), depth + 1, idx, False))
+    return {
+        "feature": tuple(feature),
+        "split": tuple(split),
+        "left": tuple(left),
+        "right": tuple(right),
+        "leaf": tuple(leaf),
+        "pathlen": tuple(pathlen),
+        "roots": tuple(roots),
+        "sampleSize": forest.get("sampleSize", 1),
+        "norm": _c_factor(forest.get("sampleSize", 1)),
+    }
 
 
-def score_isolation_forest(row: List[float], forest: Dict[str, Any]) -> float:
-    lengths = [_path_length(row, tree, 0) for tree in forest.get("trees", [])]
-    if not lengths:
+def _score_flat_forest(row: List[float], flat: Dict[str, Any]) -> float:
+    roots = flat["roots"]
+    if not roots:
         return 0.0
-    avg = sum(lengths) / len(lengths)
-    return math.pow(2, -avg / _c_factor(forest.get("sampleSize", 1)))
+    feature = flat["feature"]
+    split = flat["split"]
+    left = flat["left"]
+    right = flat["right"]
+    leaf = flat["leaf"]
+    pathlen = flat["pathlen"]
+    total = 0.0
+    for idx in roots:
+        while not leaf[idx]:
+            idx = left[idx] if row[feature[idx]] <= split[idx] else right[idx]
+        total += pathlen[idx]
+    return math.pow(2, -(total / len(roots)) / flat["norm"])
+
+
+def score_isolation_forest(row: List[float], forest: Dict[str, Any]) -> float:
+    """Score ``row`` against ``forest``, flattening each forest object only once.
+
+    Replace a forest rather than editing it in place; edits to a forest
+    that has already been scored are not seen.
+    """
+    entry = _flat_forests.get(id(forest))
+    # The entry holds a reference to its forest, so the id cannot be reused
+    # by another object while it is cached.
+    if entry is None or entry[0] is not forest:
+        if len(_flat_forests) >= _FLAT_FOREST_CACHE_SIZE:
+            _flat_forests.clear()
+        entry = _flat_forests[id(forest)] = (forest, _flatten_forest(forest))
+    return _score_flat_forest(row, entry[1])
+
+
+def _prepare_api_model(api_model: Dict[str, Any]) -> Dict[str, Any]:
+    """Precompute the per-API artifacts that scoring reads on every call."""
+    return {
+        "mean": tuple(api_model.get("mean") or []),
+        "scale": tuple(value or 1 for value in api_model.get("std") or []),
+        "core_fields": frozenset(api_model.get("coreFields") or []),
+        "forest": _flatten_forest(api_model.get("forest") or {}),
+    }
 
 
 class AnomalyScorer:
     def __init__(self, model_path: str, soft_threshold: float, strong_threshold: float) -> None:
-        self.model = load_json(model_path) or {}
-        self.feature_names = self.model.get("featureNames") or []
-        self.models = self.model.get("models") or {}
+        # The model file is read on first use, so constructing a scorer that
+        # never scores anything costs nothing.
+        self.model_path = model_path
         self.soft_threshold = soft_threshold
         self.strong_threshold = strong_threshold
+        self._feature_cache: Dict[str, "OrderedDict[str, Dict[str, Any]]"] = {}
+
+    @functools.cached_property
+    def model(self) -> Dict[str, Any]:
+        return load_json(self.model_path) or {}
+
+    @functools.cached_property
+    def feature_names(self) -> List[str]:
+        return self.model.get("featureNames") or []
+
+    @functools.cached_property
+    def models(self) -> Dict[str, Any]:
+        return self.model.get("models") or {}
+
+    @functools.cached_property
+    def _extract_row(self) -> Callable[[Dict[str, Any]], Sequence[Any]]:
+        return _row_extractor(self.feature_names)
+
+    @functools.cached_property
+    def _prepared(self) -> Dict[str, Dict[str, Any]]:
+        return {api: _prepare_api_model(api_model) for api, api_model in self.models.items()}
+
+    def _payload_features(self, api: str, parsed: Any, response_hash: Optional[str], core_fields: FrozenSet[str]) -> Dict[str, Any]:
+        if response_hash is None:
+            return _compute_payload_features(parsed, core_fields)
+        cache = self._feature_cache.setdefault(api, OrderedDict())
+        payload = cache.get(response_hash)
+        if payload is not None:
+            cache.move_to_end(response_hash)
+            return payload
+        payload = _compute_payload_features(parsed, core_fields)
+        cache[response_hash] = payload
+        if len(cache) > _FEATURE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return payload
 
     def score(self, api: str, parsed: Any, response_text: Optional[str], runtime_state: Dict[str, Dict[str, Any]], now_ms: int) -> Optional[Dict[str, Any]]:
         api_model = self.models.get(api)
@@ -167,40 +354,42 @@ class AnomalyScorer:
                 "repeat_count": 0,
             }
 
+        prepared = self._prepared[api]
         response_hash = _hash_text(response_text) if response_text else None
         state = runtime_state[api]
-        feature_data = _compute_feature_vector(parsed, {
-            "core_fields": api_model.get("coreFields") or [],
+        if response_hash and response_hash == state.get("last_response_hash"):
+            state["repeat_count"] += 1
+        else:
+            state["repeat_count"] = 0
+
+        payload = self._payload_features(api, parsed, response_hash, prepared["core_fields"])
+        feature_data = _compute_feature_vector(payload, {
             "response_hash": response_hash,
-            "last_response_hash": state.get("last_response_hash"),
             "last_response_timestamp": state.get("last_response_timestamp"),
             "last_numeric_mean": state.get("last_numeric_mean"),
-            "repeat_count": state.get("repeat_count"),
+            "repeat_count": state["repeat_count"],
             "now": now_ms,
         })
 
-        row = [feature_data["featureMap"].get(name, 0) for name in self.feature_names]
-        mean = api_model.get("mean") or []
-        std = api_model.get("std") or []
-        standardized = [
-            (row[idx] - mean[idx]) / (std[idx] or 1) if idx < len(mean) else row[idx]
-            for idx in range(len(row))
-        ]
+        row = self._extract_row(feature_data["featureMap"])
+        standardized = [(value - mean) / scale for value, mean, scale in zip(row, prepared["mean"], prepared["scale"])]
+        scaled_count = len(standardized)
+        standardized.extend(row[scaled_count:])
 
-        anomaly_score = score_isolation_forest(standardized, api_model.get("forest") or {})
+        anomaly_score = _score_flat_forest(standardized, prepared["forest"])
         anomaly_flag = "strong" if anomaly_score >= self.strong_threshold else "soft" if anomaly_score >= self.soft_threshold else "none"
 
-        top_features = []
-        for idx, name in enumerate(self.feature_names):
-            value = feature_data["featureMap"].get(name, 0)
-            z = (value - mean[idx]) / (std[idx] or 1) if idx < len(mean) else 0
-            top_features.append({"feature": name, "value": value, "z": abs(z)})
-        top_features = sorted(top_features, key=lambda item: item["z"], reverse=True)[:3]
+        # Contributing features are only reported for flagged responses;
+        # topFeatures is empty for normal traffic.
+        top_features: List[Dict[str, Any]] = []
+        if anomaly_flag != "none":
+            magnitudes = [abs(value) for value in standardized[:scaled_count]]
+            magnitudes.extend([0] * (len(row) - scaled_count))
+            top_features = [
+                {"feature": self.feature_names[idx], "value": row[idx], "z": magnitudes[idx]}
+                for idx in heapq.nlargest(3, range(len(row)), key=magnitudes.__getitem__)
+            ]
 
-        if response_hash and response_hash == state.get("last_response_hash"):
-            state["repeat_count"] += 1
-        else:
-            state["repeat_count"] = 0
         state["last_response_hash"] = response_hash
         state["last_response_timestamp"] = now_ms
         state["last_numeric_mean"] = feature_data["featureMap"].get("numeric_mean", 0)
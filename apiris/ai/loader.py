@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from .. import _json
+
 
 def load_json(path: str) -> Optional[Dict[str, Any]]:
-    file_path = Path(path)
-    if not file_path.exists():
+    try:
+        raw = Path(path).read_bytes()
+    except OSError:
         return None
     try:
-        return json.loads(file_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+        return _json.loads(raw)
+    except (_json.JSONDecodeError, UnicodeDecodeError):
         return None
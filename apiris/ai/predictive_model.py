@@ -1,23 +1,53 @@
 from __future__ import annotations
 
 import math
-from typing import List, Dict
+from typing import Any, List, Dict, Tuple
+
+_PREPARED_CACHE_SIZE = 64
+_prepared_models: Dict[int, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
 
 
 def _sigmoid(z: float) -> float:
     return 1.0 / (1.0 + math.exp(-z))
 
 
-def predict_probability(model: Dict[str, List[float]], row: List[float]) -> float:
-    mean = model.get("mean", [])
-    std = model.get("std", [])
+def prepare_model(model: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the model's standardization/weight tuples, building them once per model object.
+
+    They are kept in a side table rather than on ``model`` so loader output
+    is never modified; replace a model instead of editing it in place.
+    """
+    entry = _prepared_models.get(id(model))
+    # The entry holds a reference to its model, so the id cannot be reused
+    # by another object while it is cached.
+    if entry is not None and entry[0] is model:
+        return entry[1]
     weights = model.get("weights", [])
-    standardized = [
-        (row[idx] - mean[idx]) / (std[idx] or 1) if idx < len(mean) else row[idx]
-        for idx in range(len(row))
-    ]
-    z = weights[0] if weights else 0.0
-    for idx, value in enumerate(standardized):
-        if idx + 1 < len(weights):
-            z += weights[idx + 1] * value
+    prepared = {
+        "mean": tuple(model.get("mean", [])),
+        "scale": tuple(value or 1 for value in model.get("std", [])),
+        "bias": weights[0] if weights else 0.0,
+        "weights": tuple(weights[1:]),
+    }
+    if len(_prepared_models) >= _PREPARED_CACHE_SIZE:
+        _prepared_models.clear()
+    _prepared_models[id(model)] = (model, prepared)
+    return prepared
+
+
+def standardize(prepared: Dict[str, Any], row: List[float]) -> List[float]:
+    """Standardize ``row`` with a ``prepare_model`` result; extra features pass through unchanged."""
+    standardized = [(value - mean) / scale for value, mean, scale in zip(row, prepared["mean"], prepared["scale"])]
+    standardized.extend(row[len(standardized):])
+    return standardized
+
+
+def probability(prepared: Dict[str, Any], standardized: List[float]) -> float:
+    """Logistic probability for a row already passed through ``standardize``."""
+    z = sum((weight * value for weight, value in zip(prepared["weights"], standardized)), prepared["bias"])
     return _sigmoid(z)
+
+
+def predict_probability(model: Dict[str, List[float]], row: List[float]) -> float:
+    prepared = prepare_model(model)
+    return probability(prepared, standardize(prepared, row))
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
+import heapq
 from typing import Dict, List
 
-from .predictive_model import predict_probability
+from .predictive_model import prepare_model, probability, standardize
 
 
 def predict_tradeoff(models: Dict[str, Dict], row: List[float]) -> Dict[str, object]:
     scores: Dict[str, float] = {}
+    # Tradeoff models usually share one feature schema, so standardize the
+    # row once per distinct (mean, scale) pair rather than once per model.
+    standardized_rows: Dict[tuple, List[float]] = {}
     for tradeoff, model in models.items():
-        scores[tradeoff] = predict_probability(model, row)
+        prepared = prepare_model(model)
+        key = (prepared["mean"], prepared["scale"])
+        standardized = standardized_rows.get(key)
+        if standardized is None:
+            standardized = standardized_rows[key] = standardize(prepared, row)
+        scores[tradeoff] = probability(prepared, standardized)
     entries = sorted(scores.items(), key=lambda item: item[1], reverse=True)
     if not entries:
         return {"tradeoff": "none", "confidence": 0.0, "scores": scores}
@@ -17,9 +26,14 @@ def predict_tradeoff(models: Dict[str, Dict], row: List[float]) -> Dict[str, obj
 
 def top_contributors(model: Dict[str, List[float]], feature_names: List[str], row: List[float], count: int = 3) -> List[Dict[str, float]]:
     weights = model.get("weights", [])
-    contributions = []
-    for idx, name in enumerate(feature_names):
+    terms = []
+    for idx in range(len(feature_names)):
         weight = weights[idx + 1] if idx + 1 < len(weights) else 0
         value = row[idx] if idx < len(row) else 0
-        contributions.append({"feature": name, "weight": weight, "value": value, "impact": abs(weight * value)})
-    return sorted(contributions, key=lambda item: item["impact"], reverse=True)[:count]
+        terms.append((weight, value, abs(weight * value)))
+    # heapq.nlargest keeps the same tie order as a stable descending sort.
+    top = heapq.nlargest(count, range(len(terms)), key=lambda idx: terms[idx][2])
+    return [
+        {"feature": feature_names[idx], "weight": terms[idx][0], "value": terms[idx][1], "impact": terms[idx][2]}
+        for idx in top
+    ]
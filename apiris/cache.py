@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponseCache:
     ts: float
     status: int
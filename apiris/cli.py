@@ -7,22 +7,35 @@ Production-grade command-line interface for Apiris SDK.
 from __future__ import annotations
 
 import sys
+from bisect import bisect_right
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, BarColumn, TextColumn
-from rich.tree import Tree
-from rich import box
-
-from .client import ApirisClient
-from .config import load_config
 
 __version__ = "1.0.2"
 
+# Score bars for 0..30 filled cells, indexed by int(score * 30).
+_BARS = tuple("█" * filled + "░" * (30 - filled) for filled in range(31))
+
+# Bands indexed by bisect_right(thresholds, score): a score equal to a
+# threshold falls into the band above it.
+_SCORE_THRESHOLDS = (0.5, 0.8)
+_SCORE_BANDS = (("red", "✗ Poor"), ("yellow", "⚠ Warning"), ("green", "✓ Good"))
+_SEVERITY_COLORS = {
+    "CRITICAL": "red bold",
+    "HIGH": "red",
+    "MEDIUM": "yellow",
+    "LOW": "green",
+}
+_RISK_THRESHOLDS = (0.4, 0.6, 0.8)
+_RISK_BANDS = (
+    ("CRITICAL", "red bold", "⚠"),
+    ("HIGH", "red", "✗"),
+    ("MODERATE", "yellow", "⚠"),
+    ("LOW", "green", "✓"),
+)
+
 def get_package_models_dir() -> Path:
     """Get the models directory from the installed package."""
     return Path(__file__).parent / "models"
@@ -32,7 +45,17 @@ app = typer.Typer(
     help="Apiris - Deterministic AI Reliability Intelligence SDK",
     add_completion=False,
 )
-console = Console()
+_CONSOLE = None
+
+
+def _console():
+    """Return the shared Rich console, importing Rich on first use."""
+    global _CONSOLE
+    if _CONSOLE is None:
+        from rich.console import Console
+
+        _CONSOLE = Console()
+    return _CONSOLE
 
 
 @app.command()
@@ -40,25 +63,242 @@ def version():
     """
     Display Apiris SDK version information.
     """
+    console = _console()
     console.print(f"[bold cyan]Apiris SDK[/bold cyan] version [bold green]1.0.0[/bold green]")
     console.print("Deterministic AI Reliability Intelligence")
     console.print("https://github.com/Tarunvoff/apiris-sdk")
 
 
+def _truncate(text: str, limit: int = 80) -> str:
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _score_table():
+    """CIA score rows: label, bar, score, status."""
+    from rich.table import Table
+
+    table = Table(box=None, show_header=False, padding=(0, 2))
+    table.add_column("Label", style="bold", width=20)
+    table.add_column("Bar", width=40)
+    table.add_column("Score", width=10, justify="right")
+    table.add_column("Status", width=15)
+    return table
+
+
+def _key_value_table(key: str, key_style: str = "cyan", key_width: int = 20, border_style: Optional[str] = None):
+    """Two-column, headerless property table."""
+    from rich import box
+    from rich.table import Table
+
+    table = Table(box=box.ROUNDED, show_header=False, border_style=border_style)
+    table.add_column(key, style=key_style, width=key_width)
+    table.add_column("Value", style="white")
+    return table
+
+
+def _model_table():
+    from rich import box
+    from rich.table import Table
+
+    table = Table(box=box.ROUNDED, show_header=True, header_style="bold cyan")
+    table.add_column("Model", style="cyan")
+    table.add_column("Status", style="yellow")
+    return table
+
+
+def _cve_summary_table(title: str):
+    """Compact CVE listing shown by ``check``."""
+    from rich import box
+    from rich.table import Table
+
+    table = Table(title=title, box=box.ROUNDED, show_header=True, header_style="bold cyan")
+    table.add_column("CVE ID", style="cyan")
+    table.add_column("Severity", justify="center")
+    table.add_column("Score", justify="right")
+    table.add_column("Description", max_width=50)
+    return table
+
+
+def _cve_detail_table():
+    """Full CVE listing shown by ``cve``."""
+    from rich import box
+    from rich.table import Table
+
+    table = Table(box=box.ROUNDED, show_header=True, header_style="bold cyan")
+    table.add_column("CVE ID", style="cyan", width=18)
+    table.add_column("Severity", justify="center", width=12)
+    table.add_column("Score", justify="right", width=8)
+    table.add_column("Published", width=12)
+    table.add_column("Description", max_width=60)
+    return table
+
+
+def _check_report(response, verbose: bool, show_cve: bool) -> list:
+    """Build the renderables for one checked endpoint."""
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich.tree import Tree
+
+    # Display header
+    renderables: list = []
+    renderables.append("\n")
+    renderables.append(Panel.fit(
+        "[bold cyan]Apiris Reliability Analysis[/bold cyan]",
+        border_style="cyan"
+    ))
+    
+    # Display CIA scores with progress bars
+    renderables.append("\n[bold cyan]━━━ CIA Security Triad Scores ━━━[/bold cyan]\n")
+    
+    cad_scores = response.cad_summary.cad_scores
+    c_score = cad_scores.get("C_score", 0.0)
+    a_score = cad_scores.get("A_score", 0.0)
+    d_score = cad_scores.get("D_score", 0.0)
+    
+    # Create progress bars for scores
+    table = _score_table()
+    
+    for label, score in [("Confidentiality", c_score), ("Availability", a_score), ("Integrity", d_score)]:
+        color, status = _SCORE_BANDS[bisect_right(_SCORE_THRESHOLDS, score)]
+        bar = _BARS[min(30, max(0, int(score * 30)))]
+        table.add_row(
+            Text(label, style="cyan"),
+            Text(bar, style=color),
+            Text(f"{score:.3f}", style=color),
+            Text(status, style=color),
+        )
+    
+    renderables.append(table)
+    
+    # Risk Classification
+    avg_score = (c_score + a_score + d_score) / 3
+    risk_level, risk_color, risk_icon = _RISK_BANDS[bisect_right(_RISK_THRESHOLDS, avg_score)]
+    
+    renderables.append(f"\n[bold]Risk Classification:[/bold] [{risk_color}]{risk_icon} {risk_level}[/{risk_color}]\n")
+    
+    # Features Considered section
+    if response.scoring_factors:
+        renderables.append("[bold cyan]━━━ Features Considered in Scoring ━━━[/bold cyan]\n")
+        
+        factors = response.scoring_factors
+        thresholds = factors.get("thresholds", {})
+        
+        # Build tree for factors
+        tree = Tree("📊 Scoring Factors")
+        
+        # Confidentiality factors
+        c_factors = factors.get("confidentiality_factors", [])
+        if c_factors:
+            c_branch = tree.add(f"[cyan]🔒 Confidentiality ({len(c_factors)} factors)[/cyan]")
+            for factor in c_factors:
+                impact_icon = "❌" if factor["impact"] == "negative" else "⚠" if factor["impact"] == "neutral" else "✓"
+                c_branch.add(f"{impact_icon} {factor['name']}: {factor.get('count', factor.get('value', 'detected'))}")
+        else:
+            tree.add("[green]🔒 Confidentiality (no issues)[/green]")
+        
+        # Availability factors
+        a_factors = factors.get("availability_factors", [])
+        if a_factors:
+            a_branch = tree.add(f"[cyan]⚡ Availability ({len(a_factors)} factors)[/cyan]")
+            for factor in a_factors:
+                impact_icon = "❌" if factor["impact"] == "negative" else "✓"
+                value = factor.get('value', 'detected')
+                if 'budget' in factor:
+                    value = f"{value} (budget: {factor['budget']})"
+                a_branch.add(f"{impact_icon} {factor['name']}: {value}")
+        else:
+            tree.add("[green]⚡ Availability (no issues)[/green]")
+        
+        # Integrity factors
+        i_factors = factors.get("integrity_factors", [])
+        if i_factors:
+            i_branch = tree.add(f"[cyan]🛡 Integrity ({len(i_factors)} factors)[/cyan]")
+            for factor in i_factors:
+                impact_icon = "❌" if factor["impact"] == "negative" else "⚠" if factor["impact"] == "neutral" else "✓"
+                value = factor.get('count', factor.get('value', 'detected'))
+                i_branch.add(f"{impact_icon} {factor['name']}: {value}")
+        else:
+            tree.add("[green]🛡 Integrity (no issues)[/green]")
+        
+        renderables.append(tree)
+        renderables.append("")
+    
+    # Display decision
+    renderables.append("[bold cyan]━━━ Decision Summary ━━━[/bold cyan]\n")
+    
+    decision_table = _key_value_table("Key", key_style="bold blue", key_width=15, border_style="blue")
+    
+    action_color = "green" if response.decision.action == "pass_through" else "yellow"
+    decision_table.add_row("Action", f"[{action_color}]{response.decision.action}[/{action_color}]")
+    decision_table.add_row("Tradeoff", response.decision.tradeoff)
+    decision_table.add_row("Confidence", f"{response.decision.confidence:.1%}")
+    decision_table.add_row("Mode", response.cad_summary.mode)
+    
+    renderables.append(decision_table)
+    
+    # CVE Advisory section
+    if show_cve and response.cve_advisory:
+        cve = response.cve_advisory
+        renderables.append("\n[bold cyan]━━━ CVE Security Advisory (Advisory Only) ━━━[/bold cyan]\n")
+        
+        cve_risk_colors = {
+            "LOW": "green",
+            "MODERATE": "yellow",
+            "HIGH": "red",
+            "CRITICAL": "red bold"
+        }
+        cve_risk_color = cve_risk_colors.get(cve.risk_level, "white")
+        
+        renderables.append(f"[bold]Vendor:[/bold] {cve.vendor}")
+        renderables.append(f"[bold]Service:[/bold] {cve.service}")
+        renderables.append(f"[bold]Total CVEs:[/bold] {cve.total_cves}")
+        renderables.append(f"[bold]Advisory Score:[/bold] {cve.advisory_score:.2f}")
+        renderables.append(f"[bold]Risk Level:[/bold] [{cve_risk_color}]{cve.risk_level}[/{cve_risk_color}]\n")
+        
+        if cve.cve_entries:
+            cve_table = _cve_summary_table(f"CVE Entries (showing {min(5, len(cve.cve_entries))} of {len(cve.cve_entries)})")
+            
+            for entry in cve.cve_entries[:5]:
+                cve_table.add_row(
+                    Text(entry.id),
+                    Text(entry.severity, style=_SEVERITY_COLORS.get(entry.severity, "white")),
+                    Text(f"{entry.score:.1f}"),
+                    Text(_truncate(entry.description)),
+                )
+            
+            renderables.append(cve_table)
+            renderables.append("\n[dim italic]Note: CVE advisory is for informational purposes only and does not affect runtime decisions.[/dim italic]\n")
+    
+    if verbose:
+        renderables.append("\n[bold cyan]━━━ Response Details ━━━[/bold cyan]\n")
+        renderables.append(f"[bold]Status Code:[/bold] {response.status_code}")
+        renderables.append(f"[bold]Headers:[/bold] {len(response.headers)} headers")
+        if response.raw:
+            renderables.append(f"[bold]Body:[/bold] {len(response.raw)} bytes")
+
+    return renderables
+
+
 @app.command()
 def check(
-    url: str = typer.Argument(..., help="URL endpoint to check"),
+    urls: List[str] = typer.Argument(..., metavar="URL...", help="URL endpoint(s) to check"),
     config: Optional[str] = typer.Option(None, "--config", help="Path to config.yaml file"),
     policy: Optional[str] = typer.Option(None, "--policy", help="Path to policy.yaml file"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed output"),
     show_cve: bool = typer.Option(True, "--show-cve/--no-cve", help="Show CVE advisory information"),
 ):
     """
-    Check an AI service endpoint and evaluate reliability.
+    Check one or more AI service endpoints and evaluate reliability.
     
     Example:
         Apiris check https://api.openai.com/v1/chat/completions
+        Apiris check https://api.openai.com/v1/models https://api.anthropic.com/v1/models
     """
+    from rich.console import Group
+
+    from .client import ApirisClient
+
+    console = _console()
     try:
         # Load configuration
         config_path = config or "config.yaml"
@@ -70,232 +310,30 @@ def check(
         with console.status("[bold green]Initializing Apiris client...", spinner="dots"):
             client = ApirisClient(config_path=config_path, policy_path=policy)
         
-        # Make request
-        with console.status(f"[bold green]Checking {url}...", spinner="dots"):
-            response = client.get(url)
-        
-        # Display header
-        console.print("\n")
-        console.print(Panel.fit(
-            "[bold cyan]Apiris Reliability Analysis[/bold cyan]",
-            border_style="cyan"
-        ))
-        
-        # Display CIA scores with progress bars
-        console.print("\n[bold cyan]━━━ CIA Security Triad Scores ━━━[/bold cyan]\n")
-        
-        cad_scores = response.cad_summary.cad_scores
-        c_score = cad_scores.get("C_score", 0.0)
-        a_score = cad_scores.get("A_score", 0.0)
-        d_score = cad_scores.get("D_score", 0.0)
-        
-        def score_color(score: float) -> str:
-            if score >= 0.8:
-                return "green"
-            elif score >= 0.5:
-                return "yellow"
-            else:
-                return "red"
-        
-        def score_status(score: float) -> str:
-            if score >= 0.8:
-                return "✓ Good"
-            elif score >= 0.5:
-                return "⚠ Warning"
-            else:
-                return "✗ Poor"
-        
-        # Create progress bars for scores
-        table = Table(box=None, show_header=False, padding=(0, 2))
-        table.add_column("Label", style="bold", width=20)
-        table.add_column("Bar", width=40)
-        table.add_column("Score", width=10, justify="right")
-        table.add_column("Status", width=15)
-        
-        for label, score in [("Confidentiality", c_score), ("Availability", a_score), ("Integrity", d_score)]:
-            color = score_color(score)
-            bar_length = int(score * 30)
-            bar = "█" * bar_length + "░" * (30 - bar_length)
-            status = score_status(score)
-            table.add_row(
-                f"[cyan]{label}[/cyan]",
-                f"[{color}]{bar}[/{color}]",
-                f"[{color}]{score:.3f}[/{color}]",
-                f"[{color}]{status}[/{color}]"
-            )
-        
-        console.print(table)
-        
-        # Risk Classification
-        avg_score = (c_score + a_score + d_score) / 3
-        if avg_score >= 0.8:
-            risk_level = "LOW"
-            risk_color = "green"
-            risk_icon = "✓"
-        elif avg_score >= 0.6:
-            risk_level = "MODERATE"
-            risk_color = "yellow"
-            risk_icon = "⚠"
-        elif avg_score >= 0.4:
-            risk_level = "HIGH"
-            risk_color = "red"
-            risk_icon = "✗"
+        # Make requests; several endpoints are fetched concurrently
+        if len(urls) == 1:
+            with console.status(f"[bold green]Checking {urls[0]}...", spinner="dots"):
+                responses = [client.get(urls[0])]
         else:
-            risk_level = "CRITICAL"
-            risk_color = "red bold"
-            risk_icon = "⚠"
-        
-        console.print(f"\n[bold]Risk Classification:[/bold] [{risk_color}]{risk_icon} {risk_level}[/{risk_color}]\n")
-        
-        # Features Considered section
-        if response.scoring_factors:
-            console.print("[bold cyan]━━━ Features Considered in Scoring ━━━[/bold cyan]\n")
-            
-            factors = response.scoring_factors
-            thresholds = factors.get("thresholds", {})
-            
-            # Build tree for factors
-            tree = Tree("📊 Scoring Factors")
-            
-            # Confidentiality factors
-            c_factors = factors.get("confidentiality_factors", [])
-            if c_factors:
-                c_branch = tree.add(f"[cyan]🔒 Confidentiality ({len(c_factors)} factors)[/cyan]")
-                for factor in c_factors:
-                    impact_icon = "❌" if factor["impact"] == "negative" else "⚠" if factor["impact"] == "neutral" else "✓"
-                    c_branch.add(f"{impact_icon} {factor['name']}: {factor.get('count', factor.get('value', 'detected'))}")
-            else:
-                tree.add("[green]🔒 Confidentiality (no issues)[/green]")
-            
-            # Availability factors
-            a_factors = factors.get("availability_factors", [])
-            if a_factors:
-                a_branch = tree.add(f"[cyan]⚡ Availability ({len(a_factors)} factors)[/cyan]")
-                for factor in a_factors:
-                    impact_icon = "❌" if factor["impact"] == "negative" else "✓"
-                    value = factor.get('value', 'detected')
-                    if 'budget' in factor:
-                        value = f"{value} (budget: {factor['budget']})"
-                    a_branch.add(f"{impact_icon} {factor['name']}: {value}")
-            else:
-                tree.add("[green]⚡ Availability (no issues)[/green]")
-            
-            # Integrity factors
-            i_factors = factors.get("integrity_factors", [])
-            if i_factors:
-                i_branch = tree.add(f"[cyan]🛡 Integrity ({len(i_factors)} factors)[/cyan]")
-                for factor in i_factors:
-                    impact_icon = "❌" if factor["impact"] == "negative" else "⚠" if factor["impact"] == "neutral" else "✓"
-                    value = factor.get('count', factor.get('value', 'detected'))
-                    i_branch.add(f"{impact_icon} {factor['name']}: {value}")
-            else:
-                tree.add("[green]🛡 Integrity (no issues)[/green]")
-            
-            console.print(tree)
-            console.print()
-        
-        # Display decision
-        console.print("[bold cyan]━━━ Decision Summary ━━━[/bold cyan]\n")
-        
-        decision_table = Table(box=box.ROUNDED, show_header=False, border_style="blue")
-        decision_table.add_column("Key", style="bold blue", width=15)
-        decision_table.add_column("Value", style="white")
-        
-        action_color = "green" if response.decision.action == "pass_through" else "yellow"
-        decision_table.add_row("Action", f"[{action_color}]{response.decision.action}[/{action_color}]")
-        decision_table.add_row("Tradeoff", response.decision.tradeoff)
-        decision_table.add_row("Confidence", f"{response.decision.confidence:.1%}")
-        decision_table.add_row("Mode", response.cad_summary.mode)
-        
-        console.print(decision_table)
-        
-        # CVE Advisory section
-        if show_cve and response.cve_advisory:
-            cve = response.cve_advisory
-            console.print("\n[bold cyan]━━━ CVE Security Advisory (Advisory Only) ━━━[/bold cyan]\n")
-            
-            cve_risk_colors = {
-                "LOW": "green",
-                "MODERATE": "yellow",
-                "HIGH": "red",
-                "CRITICAL": "red bold"
-            }
-            cve_risk_color = cve_risk_colors.get(cve.risk_level, "white")
-            
-            console.print(f"[bold]Vendor:[/bold] {cve.vendor}")
-            console.print(f"[bold]Service:[/bold] {cve.service}")
-            console.print(f"[bold]Total CVEs:[/bold] {cve.total_cves}")
-            console.print(f"[bold]Advisory Score:[/bold] {cve.advisory_score:.2f}")
-            console.print(f"[bold]Risk Level:[/bold] [{cve_risk_color}]{cve.risk_level}[/{cve_risk_color}]\n")
-            
-            if cve.cve_entries:
-                cve_table = Table(
-                    title=f"CVE Entries (showing {min(5, len(cve.cve_entries))} of {len(cve.cve_entries)})",
-                    box=box.ROUNDED,
-                    show_header=True,
-                    header_style="bold cyan"
-                )
-                cve_table.add_column("CVE ID", style="cyan")
-                cve_table.add_column("Severity", justify="center")
-                cve_table.add_column("Score", justify="right")
-                cve_table.add_column("Description", max_width=50)
-                
-                for entry in cve.cve_entries[:5]:
-                    severity_colors = {
-                        "CRITICAL": "red bold",
-                        "HIGH": "red",
-                        "MEDIUM": "yellow",
-                        "LOW": "green"
-                    }
-                    sev_color = severity_colors.get(entry.severity, "white")
-                    cve_table.add_row(
-                        entry.id,
-                        f"[{sev_color}]{entry.severity}[/{sev_color}]",
-                        f"{entry.score:.1f}",
-                        entry.description[:80] + "..." if len(entry.description) > 80 else entry.description
-                    )
-                
-                console.print(cve_table)
-                console.print("\n[dim italic]Note: CVE advisory is for informational purposes only and does not affect runtime decisions.[/dim italic]\n")
-        
-        if verbose:
-            console.print("\n[bold cyan]━━━ Response Details ━━━[/bold cyan]\n")
-            console.print(f"[bold]Status Code:[/bold] {response.status_code}")
-            console.print(f"[bold]Headers:[/bold] {len(response.headers)} headers")
-            if response.raw:
-                console.print(f"[bold]Body:[/bold] {len(response.raw)} bytes")
-        
-        # Exit with appropriate code
-        if response.decision.action in ["reject_response", "block"]:
-            console.print("\n[bold red]⚠ Service blocked by policy.[/bold red]\n")
-            sys.exit(1)
-        else:
-            console.print("\n[bold green]✓ Service check complete.[/bold green]\n")
-            sys.exit(0)
-            
-    except FileNotFoundError as e:
-        console.print(f"[bold red]Error:[/bold red] {str(e)}")
-        sys.exit(1)
-    except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {str(e)}")
-        if verbose:
-            console.print_exception()
-        sys.exit(1)
-        
-        if verbose:
-            console.print("\n[bold cyan]Response Details[/bold cyan]")
-            console.print(f"Status Code: {response.status_code}")
-            console.print(f"Headers: {len(response.headers)} headers")
-            if response.raw:
-                console.print(f"Body: {len(response.raw)} bytes")
-        
+            with console.status(f"[bold green]Checking {len(urls)} endpoints...", spinner="dots"):
+                responses = client.get_many(urls)
+        
+        renderables: list = []
+        blocked = False
+        for url, response in zip(urls, responses):
+            if len(urls) > 1:
+                renderables.append(f"\n[bold]Endpoint:[/bold] {url}")
+            renderables.extend(_check_report(response, verbose, show_cve))
+            blocked = blocked or response.decision.action in ["reject_response", "block"]
+
         # Exit with appropriate code
-        if response.decision.action == "block":
-            console.print("\n[bold red]⚠ Service blocked by policy.[/bold red]")
-            sys.exit(1)
+        if blocked:
+            renderables.append("\n[bold red]⚠ Service blocked by policy.[/bold red]\n")
         else:
-            console.print("\n[bold green]✓ Service check complete.[/bold green]")
-            sys.exit(0)
+            renderables.append("\n[bold green]✓ Service check complete.[/bold green]\n")
+        # Render the whole report in one pass instead of one print per line.
+        console.print(Group(*renderables))
+        sys.exit(1 if blocked else 0)
             
     except FileNotFoundError as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
@@ -314,6 +352,11 @@ def status(
     """
     Display Apiris SDK status and configuration.
     """
+    from rich.panel import Panel
+
+    from .config import load_config
+
+    console = _console()
     try:
         # Load configuration
         config_path = config or "config.yaml"
@@ -326,9 +369,7 @@ def status(
         console.print()
         
         # Configuration status
-        table = Table(box=box.ROUNDED, show_header=False)
-        table.add_column("Setting", style="cyan", width=20)
-        table.add_column("Value", style="white")
+        table = _key_value_table("Setting")
         
         if Path(config_path).exists():
             cfg = load_config(config_path)
@@ -345,9 +386,7 @@ def status(
         
         # Check model availability
         console.print("\n[bold cyan]Model Status[/bold cyan]\n")
-        model_table = Table(box=box.ROUNDED, show_header=True, header_style="bold cyan")
-        model_table.add_column("Model", style="cyan")
-        model_table.add_column("Status", style="yellow")
+        model_table = _model_table()
         
         models_dir = get_package_models_dir()
         models = [
@@ -370,9 +409,7 @@ def status(
         cve_system = CVEAdvisorySystem()
         
         console.print("\n[bold cyan]CVE Advisory System[/bold cyan]\n")
-        cve_status = Table(box=box.ROUNDED, show_header=False)
-        cve_status.add_column("Property", style="cyan", width=20)
-        cve_status.add_column("Value", style="white")
+        cve_status = _key_value_table("Property")
         
         if cve_system.enabled:
             vendor_count = len(cve_system.cve_data)
@@ -403,6 +440,10 @@ def cve(
         Apiris cve openai
         Apiris cve anthropic --service claude-3
     """
+    from rich.panel import Panel
+    from rich.text import Text
+
+    console = _console()
     try:
         from .intelligence.cve_advisory import CVEAdvisorySystem
         
@@ -442,9 +483,7 @@ def cve(
         }
         risk_color = cve_risk_colors.get(advisory.risk_level, "white")
         
-        summary = Table(box=box.ROUNDED, show_header=False)
-        summary.add_column("Property", style="bold cyan", width=20)
-        summary.add_column("Value", style="white")
+        summary = _key_value_table("Property", key_style="bold cyan")
         
         summary.add_row("Vendor", advisory.vendor)
         summary.add_row("Service", advisory.service)
@@ -458,33 +497,15 @@ def cve(
         if advisory.cve_entries:
             console.print(f"\n[bold cyan]CVE Entries ({len(advisory.cve_entries)} total)[/bold cyan]\n")
             
-            cve_table = Table(
-                box=box.ROUNDED,
-                show_header=True,
-                header_style="bold cyan"
-            )
-            cve_table.add_column("CVE ID", style="cyan", width=18)
-            cve_table.add_column("Severity", justify="center", width=12)
-            cve_table.add_column("Score", justify="right", width=8)
-            cve_table.add_column("Published", width=12)
-            cve_table.add_column("Description", max_width=60)
-            
-            severity_colors = {
-                "CRITICAL": "red bold",
-                "HIGH": "red",
-                "MEDIUM": "yellow",
-                "LOW": "green"
-            }
+            cve_table = _cve_detail_table()
             
             for entry in advisory.cve_entries:
-                sev_color = severity_colors.get(entry.severity, "white")
-                desc = entry.description[:80] + "..." if len(entry.description) > 80 else entry.description
                 cve_table.add_row(
-                    entry.id,
-                    f"[{sev_color}]{entry.severity}[/{sev_color}]",
-                    f"{entry.score:.1f}",
-                    entry.published_date[:10] if len(entry.published_date) >= 10 else entry.published_date,
-                    desc
+                    Text(entry.id),
+                    Text(entry.severity, style=_SEVERITY_COLORS.get(entry.severity, "white")),
+                    Text(f"{entry.score:.1f}"),
+                    Text(entry.published_date[:10]),
+                    Text(_truncate(entry.description)),
                 )
             
             console.print(cve_table)
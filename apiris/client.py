@@ -1,33 +1,58 @@
 from __future__ import annotations
 
-import json
 import time
 import uuid
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from . import _json
 from .config import load_config
 from .decision_engine import DecisionEngine
 from .evaluator import ObservationEvaluator
 from .interceptor import ResponseInterceptor
-from .log_utils import append_jsonl
+from .log_utils import JsonlAppender
 from .policy.policy_loader import PolicyLoader
 from .policy.policy_manager import PolicyManager
 from .ai.anomaly_model import AnomalyScorer
 from .intelligence.cve_advisory import CVEAdvisorySystem, CVEAdvisory
 
+# Keep-alive pool per host; requests' default of 10 forces reconnects
+# (and TLS handshakes) once a client is used from several threads.
+_POOL_SIZE = 32
+_URL_CACHE_SIZE = 1024
+# Shared read-only stand-in for missing observation sections.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
 
-@dataclass
+
+def _release(session: requests.Session, log_writers: Tuple[JsonlAppender, ...]) -> None:
+    for writer in log_writers:
+        writer.close()
+    session.close()
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def _split_url(url: str) -> Tuple[str, str]:
+    """Return ``(api_name, endpoint)`` for a request URL."""
+    parsed_url = urlparse(url)
+    return parsed_url.netloc or url, parsed_url.path or "/"
+
+
+@dataclass(slots=True)
 class ApirisDecision:
     action: str
     tradeoff: str
     confidence: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ApirisSummary:
     cad_scores: Dict[str, float]
     mode: str
@@ -35,7 +60,7 @@ class ApirisSummary:
     tradeoff: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ApirisResponse:
     data: Any
     cad_summary: ApirisSummary
@@ -52,6 +77,9 @@ class ApirisClient:
     def __init__(self, config_path: str = "config.yaml", policy_path: Optional[str] = None) -> None:
         self.config = load_config(config_path)
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         policy_manager = None
         if policy_path:
             try:
@@ -84,25 +112,70 @@ class ApirisClient:
             "predictions": f"{self.config.log_dir}/cad_predictions.jsonl",
             "anomalies": f"{self.config.log_dir}/cad_anomalies.jsonl",
         }
+        # Files are opened on first write and kept for the client's lifetime.
+        self._log_writers: Dict[str, JsonlAppender] = {key: JsonlAppender(path) for key, path in self.log_paths.items()}
+        # Runs on close() or when the client is garbage collected, whichever comes first.
+        self._finalizer = weakref.finalize(self, _release, self.session, tuple(self._log_writers.values()))
+
+    def close(self) -> None:
+        """Close the log files and the HTTP session. Safe to call more than once."""
+        self._finalizer()
+
+    def __enter__(self) -> "ApirisClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _write_logs(self, keys: Iterable[str], payload: Dict[str, Any]) -> None:
+        try:
+            line = _json.dumps_bytes(payload) + b"\n"
+        except ValueError:
+            return
+        for key in keys:
+            self._log_writers[key].write_line(line)
 
     def get(self, url: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None, timeout: float = 5.0) -> ApirisResponse:
-        request_id = uuid.uuid4().hex
-        started_at = time.time()
-        parsed_url = urlparse(url)
-        api_name = parsed_url.netloc or url
-        endpoint = parsed_url.path or "/"
+        fetched = self._fetch(url, params, headers, timeout)
+        return self._process(url, params, headers, fetched)
+
+    def get_many(self, urls: List[str], params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None, timeout: float = 5.0, max_workers: Optional[int] = None) -> List[ApirisResponse]:
+        """Fetch several URLs concurrently and evaluate them in order.
+
+        Only the network round-trips overlap; evaluation, CVE lookups,
+        decisions and logging run sequentially in ``urls`` order, exactly as
+        repeated ``get`` calls.
+        """
+        if not urls:
+            return []
+        workers = max_workers or min(len(urls), _POOL_SIZE)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            fetches = [executor.submit(self._fetch, url, params, headers, timeout) for url in urls]
+            # Earlier responses are evaluated while later ones are still in flight.
+            return [self._process(url, params, headers, fetch.result()) for url, fetch in zip(urls, fetches)]
 
+    def _advisory_for_url(self, url: str) -> Optional[CVEAdvisory]:
+        if not self.cve_system.enabled:
+            return None
+        vendor = self.cve_system.extract_vendor_from_url(url)
+        return self.cve_system.get_advisory(vendor) if vendor else None
+
+    def _fetch(self, url: str, params: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]], timeout: float) -> Dict[str, Any]:
+        started_at = time.time()
         response_dict: Optional[Dict[str, Any]] = None
         error: Optional[Dict[str, str]] = None
         raw_text: Optional[str] = None
         status_code: Optional[int] = None
-        response_headers: Dict[str, Any] = {}
+        response_headers: Mapping[str, Any] = {}
 
         try:
             res = self.session.get(url, params=params, headers=headers, timeout=timeout)
             raw_text = res.text
             status_code = res.status_code
-            response_headers = dict(res.headers)
+            # requests' CaseInsensitiveDict, passed through as-is so header
+            # lookups downstream ("content-type", "x-ratelimit-remaining", ...)
+            # match regardless of the server's casing.
+            response_headers = res.headers
             response_dict = {
                 "status": status_code,
                 "headers": response_headers,
@@ -113,7 +186,25 @@ class ApirisClient:
         except requests.RequestException as err:
             error = {"name": err.__class__.__name__, "message": str(err)}
 
-        timing_ms = int((time.time() - started_at) * 1000)
+        return {
+            "response": response_dict,
+            "error": error,
+            "raw_text": raw_text,
+            "status_code": status_code,
+            "headers": response_headers,
+            "timing_ms": int((time.time() - started_at) * 1000),
+        }
+
+    def _process(self, url: str, params: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]], fetched: Dict[str, Any]) -> ApirisResponse:
+        request_id = uuid.uuid4().hex
+        api_name, endpoint = _split_url(url)
+
+        response_dict = fetched["response"]
+        error = fetched["error"]
+        raw_text = fetched["raw_text"]
+        status_code = fetched["status_code"]
+        response_headers = fetched["headers"]
+        timing_ms = fetched["timing_ms"]
 
         request_payload = {
             "method": "GET",
@@ -142,8 +233,8 @@ class ApirisClient:
         parsed_body = None
         if raw_text:
             try:
-                parsed_body = json.loads(raw_text)
-            except json.JSONDecodeError:
+                parsed_body = _json.loads(raw_text)
+            except _json.JSONDecodeError:
                 parsed_body = None
 
         decision_result = self.decision_engine.evaluate(
@@ -166,13 +257,14 @@ class ApirisClient:
         )
 
         cad_scores = decision.get("scores", {})
+        integrity = observation.get("integrity") or _EMPTY
         if self.ai_enabled:
             ai_signals = {
                 "enabled": True,
-                "anomaly_score": observation.get("integrity", {}).get("aiAnomalyScore"),
-                "anomaly_flag": observation.get("integrity", {}).get("aiAnomalyFlag"),
-                "anomaly_features": observation.get("integrity", {}).get("aiTopFeatures"),
-                "anomaly_schema_hash": observation.get("integrity", {}).get("aiSchemaHash"),
+                "anomaly_score": integrity.get("aiAnomalyScore"),
+                "anomaly_flag": integrity.get("aiAnomalyFlag"),
+                "anomaly_features": integrity.get("aiTopFeatures"),
+                "anomaly_schema_hash": integrity.get("aiSchemaHash"),
             }
         else:
             ai_signals = {"enabled": False}
@@ -193,15 +285,14 @@ class ApirisClient:
             "ai_signals": ai_signals,
             "decision": decision_payload,
             "mode": self.config.mode,
-            "latency_ms": observation.get("availability", {}).get("latencyMs"),
-            "schema_changed": observation.get("integrity", {}).get("schemaChanged"),
+            "latency_ms": (observation.get("availability") or _EMPTY).get("latencyMs"),
+            "schema_changed": integrity.get("schemaChanged"),
         }
 
-        append_jsonl(self.log_paths["observations"], log_entry)
-        append_jsonl(self.log_paths["decisions"], log_entry)
         if self.ai_enabled:
-            append_jsonl(self.log_paths["predictions"], log_entry)
-            append_jsonl(self.log_paths["anomalies"], log_entry)
+            self._write_logs(("observations", "decisions", "predictions", "anomalies"), log_entry)
+        else:
+            self._write_logs(("observations", "decisions"), log_entry)
 
         response_data = parsed_body if parsed_body is not None else raw_text
 
@@ -218,11 +309,7 @@ class ApirisClient:
         scoring_factors = decision.get("scoring_factors")
         
         # Get CVE advisory (advisory-only, never affects runtime)
-        cve_advisory = None
-        if self.cve_system.enabled:
-            vendor = self.cve_system.extract_vendor_from_url(url)
-            if vendor:
-                cve_advisory = self.cve_system.get_advisory(vendor)
+        cve_advisory = self._advisory_for_url(url)
 
         return ApirisResponse(
             data=response_data,
@@ -230,7 +317,7 @@ class ApirisClient:
             decision=cad_decision,
             confidence=cad_decision.confidence,
             status_code=status_code,
-            headers=response_headers,
+            headers=dict(response_headers),
             raw=effective_response.get("body") if isinstance(effective_response, dict) else raw_text,
             scoring_factors=scoring_factors,
             cve_advisory=cve_advisory,
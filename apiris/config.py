@@ -1,10 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-import yaml
+from typing import Any, Dict, Optional, Tuple
 
 
 @dataclass
@@ -26,19 +24,57 @@ class ApirisConfig:
         return self.integrity_threshold
 
 
+_YAML_MODULE = None
+_YAML_LOADER = None
+
+
+def _get_loader() -> Any:
+    """Import PyYAML on first use and return its safe loader.
+
+    Prefers the libyaml-backed CSafeLoader (same safe semantics, much
+    faster parsing) and falls back to the pure-Python SafeLoader.
+    """
+    global _YAML_MODULE, _YAML_LOADER
+    if _YAML_LOADER is None:
+        import yaml
+
+        _YAML_MODULE = yaml
+        _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return _YAML_LOADER
+
+
 def _load_yaml(path: Path) -> Dict[str, Any]:
     if not path.exists():
         return {}
+    loader = _get_loader()
     with path.open("r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle) or {}
+        data = _YAML_MODULE.load(handle, Loader=loader) or {}
     if not isinstance(data, dict):
         return {}
     return data
 
 
+# absolute path -> ((st_mtime_ns, st_size), parsed config)
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], ApirisConfig]] = {}
+
+
 def load_config(path: str = "config.yaml") -> ApirisConfig:
     config_path = Path(path)
-    raw = _load_yaml(config_path)
+    try:
+        stat = config_path.stat()
+    except OSError:
+        return _parse_config({})
+    key = str(config_path.absolute())
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, _parse_config(_load_yaml(config_path)))
+        _CONFIG_CACHE[key] = cached
+    # Callers own (and may mutate) the returned config.
+    return replace(cached[1])
+
+
+def _parse_config(raw: Dict[str, Any]) -> ApirisConfig:
     Apiris = raw.get("Apiris", {}) if isinstance(raw, dict) else {}
     if not isinstance(Apiris, dict):
         Apiris = {}
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import time
+from collections import deque
 from urllib.parse import urlparse
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional, Tuple
 
+from . import _json
+from ._clock import iso_timestamp
+from ._sensitive import SENSITIVE_KEY_RE
 from .cache import ResponseCache
 from .config import ApirisConfig
 from .policy.policy_manager import PolicyManager
 
+_PROFILE_CACHE_SIZE = 1024
+_URL_CACHE_SIZE = 1024
 
-DEFAULT_PROFILE = {
+# Read-only; engines copy it into their own base profile.
+DEFAULT_PROFILE: Mapping[str, Any] = MappingProxyType({
     "confidentiality_threshold": None,
     "availability_threshold": None,
     "integrity_threshold": None,
@@ -23,48 +31,124 @@ DEFAULT_PROFILE = {
     "latency_budget_ms": 1000,
     "prefer": "availability",
     "delay_ms": 400,
-}
-
-
-def _hash_text(text: Optional[str]) -> Optional[str]:
-    if text is None:
-        return None
-    return hashlib.sha256(str(text).encode("utf-8")).hexdigest()
+})
+
+# Signal summary for observations without confidentiality, availability or
+# integrity details; shared read-only across calls.
+_ZERO_SUMMARY = MappingProxyType({
+    "confidentialitySignals": 0,
+    "availabilitySignals": 0,
+    "integritySignals": 0,
+    "aiAnomalyScore": 0,
+})
+
+# Shared, read-only decisions for the common no-op outcomes.
+_PASS_THROUGH = MappingProxyType({
+    "action": "pass_through",
+    "tradeoff": "none",
+    "justification": "Scores within acceptable bounds",
+})
+_PASSIVE_PASS_THROUGH = MappingProxyType({
+    "action": "pass_through",
+    "tradeoff": "none",
+    "justification": "Passive mode: observe only",
+})
 
 
 def _mask_sensitive_fields(value: Any, depth: int = 0, max_depth: int = 6) -> Any:
+    """Return ``value`` with sensitive dict keys masked.
+
+    Containers with nothing to mask are returned as-is instead of being
+    rebuilt, so only the path down to a masked key gets copied.
+    """
     if depth > max_depth:
         return value
     if isinstance(value, list):
-        return [_mask_sensitive_fields(item, depth + 1, max_depth) for item in value]
+        items = None
+        for index, item in enumerate(value):
+            if isinstance(item, (dict, list)):
+                masked = _mask_sensitive_fields(item, depth + 1, max_depth)
+                if masked is not item:
+                    if items is None:
+                        items = list(value)
+                    items[index] = masked
+        return value if items is None else items
     if not isinstance(value, dict):
         return value
 
-    patterns = [
-        "password",
-        "secret",
-        "token",
-        "api_key",
-        "api-key",
-        "auth",
-        "cookie",
-        "session",
-        "jwt",
-    ]
-    result: Dict[str, Any] = {}
+    result: Optional[Dict[str, Any]] = None
     for key, val in value.items():
-        key_lower = str(key).lower()
-        if any(pattern in key_lower for pattern in patterns):
-            result[key] = "[MASKED]"
+        if SENSITIVE_KEY_RE.search(key if isinstance(key, str) else str(key)):
+            masked = "[MASKED]"
+        elif isinstance(val, (dict, list)):
+            masked = _mask_sensitive_fields(val, depth + 1, max_depth)
         else:
-            result[key] = _mask_sensitive_fields(val, depth + 1, max_depth)
-    return result
+            continue
+        if masked is not val:
+            if result is None:
+                result = dict(value)
+            result[key] = masked
+    return value if result is None else result
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def _url_path(url: str) -> str:
+    return urlparse(url).path
+
+
+def _clamp(value: float) -> float:
+    return max(0.0, min(1.0, value))
+
+
+def _breach(score: float, threshold: Optional[float]) -> float:
+    if threshold is None or threshold <= 0:
+        return 0.0
+    if score >= threshold:
+        return 0.0
+    return _clamp((threshold - score) / max(threshold, 1e-6))
+
 
+class WindowEntry(NamedTuple):
+    ts: int
+    confidentialitySignals: int
+    availabilitySignals: int
+    integritySignals: int
+    aiAnomalyScore: float
 
-@dataclass
+
+@dataclass(slots=True)
 class DecisionEngineState:
-    window: list = field(default_factory=list)
+    window: deque = field(default_factory=deque)
     cache: Optional[ResponseCache] = None
+    # Running totals over ``window``, updated as entries are added and expired.
+    confidentiality_sum: int = 0
+    availability_sum: int = 0
+    integrity_sum: int = 0
+    ai_score_sum: float = 0.0
+    ai_score_count: int = 0
+
+    def add(self, entry: WindowEntry) -> None:
+        self.window.append(entry)
+        self.confidentiality_sum += entry.confidentialitySignals
+        self.availability_sum += entry.availabilitySignals
+        self.integrity_sum += entry.integritySignals
+        if entry.aiAnomalyScore > 0:
+            self.ai_score_sum += entry.aiAnomalyScore
+            self.ai_score_count += 1
+
+    def expire(self, cutoff: int) -> None:
+        window = self.window
+        while window and window[0].ts < cutoff:
+            entry = window.popleft()
+            self.confidentiality_sum -= entry.confidentialitySignals
+            self.availability_sum -= entry.availabilitySignals
+            self.integrity_sum -= entry.integritySignals
+            if entry.aiAnomalyScore > 0:
+                self.ai_score_sum -= entry.aiAnomalyScore
+                self.ai_score_count -= 1
+        if not self.ai_score_count:
+            # Drop accumulated float error once no scored entries remain.
+            self.ai_score_sum = 0.0
 
 
 class DecisionEngine:
@@ -73,45 +157,106 @@ class DecisionEngine:
         self.window_ms = config.window_ms
         self.cache_ttl_ms = config.cache_ttl_ms
         self.ai_anomaly_weight = 0.0
+        self._profile_cache: Dict[Tuple[str, Optional[str], int], Mapping[str, Any]] = {}
         self.profiles = profiles or {}
         self.policy_manager = policy_manager
         self.state: Dict[str, DecisionEngineState] = {}
+        self._config_signature: Optional[Tuple[Any, ...]] = None
+        self._refresh_base_profile()
+        # Actions without an entry (pass_through) leave the response untouched.
+        self._action_handlers: Dict[str, Callable[..., Dict[str, Any]]] = {
+            "mask_sensitive_fields": self._apply_mask,
+            "serve_stale_cache": self._apply_stale,
+            "reject_response": self._apply_reject,
+            "downgrade_fidelity": self._apply_downgrade,
+            "delay_response": self._apply_delay,
+        }
 
-    def _get_profile(self, api: str, endpoint: Optional[str] = None) -> Dict[str, Any]:
-        profile = DEFAULT_PROFILE.copy()
-        profile.update(
-            {
-                "confidentiality_threshold": self.config.confidentiality_threshold,
-                "availability_threshold": self.config.availability_threshold,
-                "integrity_threshold": self.config.integrity_threshold,
-                "availability_delay_threshold": self.config.availability_threshold,
-                "latency_budget_ms": self.config.latency_budget_ms,
-            }
+    @property
+    def profiles(self) -> Dict[str, Dict[str, Any]]:
+        """Per-API profile overrides.
+
+        Resolved profiles are cached, so assign a new dict to change them;
+        in-place edits are not picked up. The same holds for the policy
+        manager's ``policy``, whose cache key is ``policy_manager.version()``.
+        """
+        return self._profiles
+
+    @profiles.setter
+    def profiles(self, profiles: Dict[str, Dict[str, Any]]) -> None:
+        self._profiles = profiles
+        self._profile_cache.clear()
+
+    def _refresh_base_profile(self) -> None:
+        """Rebuild the config-derived base profile if the config changed since the last call."""
+        config = self.config
+        signature = (
+            config.confidentiality_threshold,
+            config.availability_threshold,
+            config.integrity_threshold,
+            config.latency_budget_ms,
+            config.mode,
         )
-        profile.update(self.profiles.get(api, {}))
-        if self.policy_manager:
-            profile = self.policy_manager.apply_to_profile(profile, api, endpoint)
+        if signature == self._config_signature:
+            return
+        self._config_signature = signature
+        # DEFAULT_PROFILE merged with the config thresholds; per-API and
+        # policy overrides are layered on top of a copy of this.
+        self._base_profile = {
+            **DEFAULT_PROFILE,
+            "confidentiality_threshold": config.confidentiality_threshold,
+            "availability_threshold": config.availability_threshold,
+            "integrity_threshold": config.integrity_threshold,
+            "availability_delay_threshold": config.availability_threshold,
+            "latency_budget_ms": config.latency_budget_ms,
+        }
+        # Shared read-only profile for APIs without any overrides.
+        self._default_profile = MappingProxyType(self._apply_mode(self._base_profile.copy()))
+        self._profile_cache.clear()
+
+    def _apply_mode(self, profile: Dict[str, Any]) -> Dict[str, Any]:
         if self.config.mode == "strict":
             profile["integrity_threshold"] = self.config.integrity_threshold
             profile["prefer"] = "integrity"
         return profile
 
+    def _get_profile(self, api: str, endpoint: Optional[str] = None) -> Mapping[str, Any]:
+        self._refresh_base_profile()
+        overrides = self.profiles.get(api)
+        if not overrides and not self.policy_manager:
+            return self._default_profile
+        key = (api, endpoint, self.policy_manager.version() if self.policy_manager else 0)
+        cached = self._profile_cache.get(key)
+        if cached is not None:
+            return cached
+        profile = self._base_profile.copy()
+        if overrides:
+            profile.update(overrides)
+        if self.policy_manager:
+            profile = self.policy_manager.apply_to_profile(profile, api, endpoint)
+        if len(self._profile_cache) >= _PROFILE_CACHE_SIZE:
+            self._profile_cache.clear()
+        cached = self._profile_cache[key] = MappingProxyType(self._apply_mode(profile))
+        return cached
+
     def _get_state(self, api: str) -> DecisionEngineState:
         if api not in self.state:
             self.state[api] = DecisionEngineState()
         return self.state[api]
 
-    def _summarize_signals(self, observation: Dict[str, Any], profile: Dict[str, Any]) -> Dict[str, Any]:
-        confidentiality = observation.get("confidentiality") or {}
-        availability = observation.get("availability") or {}
-        integrity = observation.get("integrity") or {}
+    def _summarize_signals(self, observation: Dict[str, Any], profile: Mapping[str, Any]) -> Mapping[str, Any]:
+        confidentiality = observation.get("confidentiality")
+        availability = observation.get("availability")
+        integrity = observation.get("integrity")
+        if not (confidentiality or availability or integrity):
+            return _ZERO_SUMMARY
 
         confidentiality_signals = (
             len(confidentiality.get("sensitiveFields") or [])
             + len(confidentiality.get("authHintsInPayload") or [])
             + len(confidentiality.get("verboseErrorSignals") or [])
             + len(confidentiality.get("headerExposure") or [])
-        )
+        ) if confidentiality else 0
 
         availability_signals = (
             int(bool(availability.get("rateLimited")))
@@ -119,17 +264,20 @@ class DecisionEngine:
             + int(bool(availability.get("softTimeoutExceeded")))
             + int(bool(availability.get("status") and availability.get("status") >= 500))
             + int(bool(availability.get("latencyMs", 0) > profile["latency_budget_ms"]))
-        )
-
-        integrity_signals = (
-            int(bool(integrity.get("schemaChanged")))
-            + int(bool(integrity.get("temporalDrift")))
-            + int(bool(integrity.get("replayedPayload")))
-            + int(bool(integrity.get("crossEndpointInconsistencies")))
-        )
-
-        ai_anomaly_score = integrity.get("aiAnomalyScore")
-        if not isinstance(ai_anomaly_score, (int, float)):
+        ) if availability else 0
+
+        if integrity:
+            integrity_signals = (
+                int(bool(integrity.get("schemaChanged")))
+                + int(bool(integrity.get("temporalDrift")))
+                + int(bool(integrity.get("replayedPayload")))
+                + int(bool(integrity.get("crossEndpointInconsistencies")))
+            )
+            ai_anomaly_score = integrity.get("aiAnomalyScore")
+            if not isinstance(ai_anomaly_score, (int, float)):
+                ai_anomaly_score = 0
+        else:
+            integrity_signals = 0
             ai_anomaly_score = 0
 
         return {
@@ -138,7 +286,7 @@ class DecisionEngine:
             "integritySignals": integrity_signals,
             "aiAnomalyScore": ai_anomaly_score,
         }
-    
+
     def _extract_scoring_factors(self, observation: Dict[str, Any], profile: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extract all features/factors considered in CIA scoring for transparency.
@@ -291,10 +439,14 @@ class DecisionEngine:
         availability_rate = aggregates["availabilitySignals"] / total
         integrity_rate = aggregates["integritySignals"] / total
 
+        # Inlined _compute_score: max(0.0, 1.0 - rate * weight).
+        c_score = 1.0 - confidentiality_rate * profile["confidentiality_weight"]
+        a_score = 1.0 - availability_rate * profile["availability_weight"]
+        d_score = 1.0 - integrity_rate * profile["integrity_weight"]
         return {
-            "C_score": self._compute_score(confidentiality_rate, profile["confidentiality_weight"]),
-            "A_score": self._compute_score(availability_rate, profile["availability_weight"]),
-            "D_score": self._compute_score(integrity_rate, profile["integrity_weight"]),
+            "C_score": c_score if c_score > 0.0 else 0.0,
+            "A_score": a_score if a_score > 0.0 else 0.0,
+            "D_score": d_score if d_score > 0.0 else 0.0,
             "integrityRate": integrity_rate,
         }
 
@@ -308,7 +460,7 @@ class DecisionEngine:
             }
         return None
 
-    def _choose_action(self, scores: Dict[str, Any], profile: Dict[str, Any]) -> Dict[str, str]:
+    def _choose_action(self, scores: Dict[str, Any], profile: Mapping[str, Any]) -> Mapping[str, str]:
         c_score = scores["C_score"]
         a_score = scores["A_score"]
         d_score = scores["D_score"]
@@ -317,194 +469,179 @@ class DecisionEngine:
             if strict_action:
                 return strict_action
 
-        if c_score < profile["confidentiality_threshold"]:
+        c_thr = profile["confidentiality_threshold"]
+        a_thr = profile["availability_threshold"]
+        d_thr = profile["integrity_threshold"]
+        if c_score < c_thr:
             return {
                 "action": "mask_sensitive_fields",
                 "tradeoff": "confidentiality_over_completeness",
-                "justification": f"C_score {c_score:.2f} below {profile['confidentiality_threshold']}",
+                "justification": f"C_score {c_score:.2f} below {c_thr}",
             }
 
-        if a_score < profile["availability_threshold"] and d_score >= profile["integrity_threshold"]:
+        if a_score < a_thr and d_score >= d_thr:
             return {
                 "action": "serve_stale_cache",
                 "tradeoff": "availability_over_integrity",
-                "justification": f"A_score {a_score:.2f} below {profile['availability_threshold']} while D_score {d_score:.2f} >= {profile['integrity_threshold']}",
+                "justification": f"A_score {a_score:.2f} below {a_thr} while D_score {d_score:.2f} >= {d_thr}",
             }
 
-        if d_score < profile["integrity_threshold"] and a_score >= profile["availability_threshold"]:
+        if d_score < d_thr and a_score >= a_thr:
             return {
                 "action": "reject_response",
                 "tradeoff": "integrity_over_availability",
-                "justification": f"D_score {d_score:.2f} below {profile['integrity_threshold']} while A_score {a_score:.2f} >= {profile['availability_threshold']}",
+                "justification": f"D_score {d_score:.2f} below {d_thr} while A_score {a_score:.2f} >= {a_thr}",
             }
 
-        if a_score < profile["availability_threshold"] and d_score < profile["integrity_threshold"]:
-            action = "serve_stale_cache" if profile["prefer"] == "availability" else "downgrade_fidelity"
-            tradeoff = "availability_over_integrity" if profile["prefer"] == "availability" else "integrity_over_availability"
+        if a_score < a_thr and d_score < d_thr:
+            prefer = profile["prefer"]
+            action = "serve_stale_cache" if prefer == "availability" else "downgrade_fidelity"
+            tradeoff = "availability_over_integrity" if prefer == "availability" else "integrity_over_availability"
             return {
                 "action": action,
                 "tradeoff": tradeoff,
-                "justification": f"Both A_score {a_score:.2f} and D_score {d_score:.2f} below thresholds; prefer {profile['prefer']}",
+                "justification": f"Both A_score {a_score:.2f} and D_score {d_score:.2f} below thresholds; prefer {prefer}",
             }
 
-        if a_score < profile["availability_delay_threshold"]:
+        delay_thr = profile["availability_delay_threshold"]
+        if a_score < delay_thr:
             return {
                 "action": "delay_response",
                 "tradeoff": "integrity_over_availability",
-                "justification": f"A_score {a_score:.2f} below {profile['availability_delay_threshold']}, apply delay",
+                "justification": f"A_score {a_score:.2f} below {delay_thr}, apply delay",
             }
 
-        return {
-            "action": "pass_through",
-            "tradeoff": "none",
-            "justification": "Scores within acceptable bounds",
-        }
+        return _PASS_THROUGH
 
     def _compute_confidence(self, scores: Dict[str, Any], scores_with_ai: Dict[str, Any], profile: Dict[str, Any], action: str, ai_used: bool) -> float:
-        def clamp(value: float) -> float:
-            return max(0.0, min(1.0, value))
-
-        def breach(score: float, threshold: Optional[float]) -> float:
-            if threshold is None or threshold <= 0:
-                return 0.0
-            if score >= threshold:
-                return 0.0
-            return clamp((threshold - score) / max(threshold, 1e-6))
-
-        thresholds = {
-            "C_score": profile["confidentiality_threshold"],
-            "A_score": profile["availability_threshold"],
-            "D_score": profile["integrity_threshold"],
-        }
-        in_bounds = all(
-            scores[key] >= (thresholds[key] if thresholds[key] is not None else 0.0)
-            for key in ("C_score", "A_score", "D_score")
-        )
-
-        if action == "pass_through" and in_bounds:
+        c_score = scores["C_score"]
+        a_score = scores["A_score"]
+        d_score = scores["D_score"]
+        c_thr = profile["confidentiality_threshold"]
+        a_thr = profile["availability_threshold"]
+        d_thr = profile["integrity_threshold"]
+        mode = self.config.mode
+
+        if action == "pass_through" and (
+            c_score >= (c_thr if c_thr is not None else 0.0)
+            and a_score >= (a_thr if a_thr is not None else 0.0)
+            and d_score >= (d_thr if d_thr is not None else 0.0)
+        ):
             base_confidence = 1.0
-        elif self.config.mode == "passive":
+        elif mode == "passive":
             base_confidence = 1.0
-        elif self.config.mode == "strict" and scores["D_score"] < profile["integrity_threshold"]:
+        elif mode == "strict" and d_score < d_thr:
             base_confidence = 1.0
         else:
             base_confidence = max(
-                breach(scores["C_score"], profile["confidentiality_threshold"]),
-                breach(scores["A_score"], profile["availability_threshold"]),
-                breach(scores["D_score"], profile["integrity_threshold"]),
+                _breach(c_score, c_thr),
+                _breach(a_score, a_thr),
+                _breach(d_score, d_thr),
             )
 
         if ai_used:
-            ai_confidence = clamp(float(scores_with_ai.get("aiAnomalyAvg", 0.0)))
+            ai_confidence = _clamp(float(scores_with_ai.get("aiAnomalyAvg", 0.0)))
             base_confidence = max(base_confidence, ai_confidence)
 
-        return round(clamp(base_confidence), 2)
+        return round(_clamp(base_confidence), 2)
 
     def get_cache(self, api: str) -> Optional[ResponseCache]:
         return self._get_state(api).cache
 
-    def _aggregate_window(self, window: list) -> Dict[str, Any]:
-        aggregates = {
-            "total": len(window),
-            "confidentialitySignals": 0,
-            "availabilitySignals": 0,
-            "integritySignals": 0,
-            "aiAnomalyScoreSum": 0.0,
-            "aiAnomalyScoreCount": 0,
+    def _aggregate_window(self, api_state: DecisionEngineState) -> Dict[str, Any]:
+        return {
+            "total": len(api_state.window),
+            "confidentialitySignals": api_state.confidentiality_sum,
+            "availabilitySignals": api_state.availability_sum,
+            "integritySignals": api_state.integrity_sum,
+            "aiAnomalyScoreSum": api_state.ai_score_sum,
+            "aiAnomalyScoreCount": api_state.ai_score_count,
         }
-        for entry in window:
-            aggregates["confidentialitySignals"] += entry["confidentialitySignals"]
-            aggregates["availabilitySignals"] += entry["availabilitySignals"]
-            aggregates["integritySignals"] += entry["integritySignals"]
-            if entry["aiAnomalyScore"] > 0:
-                aggregates["aiAnomalyScoreSum"] += entry["aiAnomalyScore"]
-                aggregates["aiAnomalyScoreCount"] += 1
-        return aggregates
-
-    def _build_effective_response(self, action: str, input_data: Dict[str, Any], cache: Optional[ResponseCache], profile: Dict[str, Any]) -> Dict[str, Any]:
-        response_text = input_data.get("response_text")
-        parsed = input_data.get("parsed")
-        response_headers = input_data.get("response_headers") or {}
-        response_status = input_data.get("response_status")
 
-        if action == "pass_through" or response_status is None:
+    def _build_effective_response(self, action: str, input_data: Dict[str, Any], cache: Optional[ResponseCache], profile: Dict[str, Any], now_ms: float) -> Dict[str, Any]:
+        handler = self._action_handlers.get(action)
+        if handler is None or input_data.get("response_status") is None:
             return {"applied": False, "effectiveResponse": None}
+        return handler(input_data, cache, profile, now_ms)
 
-        if action == "mask_sensitive_fields":
-            if not isinstance(parsed, dict):
-                return {"applied": False, "effectiveResponse": None, "reason": "non-json-response"}
-            masked = _mask_sensitive_fields(parsed)
-            return {
-                "applied": True,
-                "effectiveResponse": {
-                    "status": response_status,
-                    "headers": response_headers,
-                    "body": json.dumps(masked),
-                    "contentType": "application/json",
-                    "modified": "masked_sensitive_fields",
-                },
-            }
-
-        if action == "serve_stale_cache":
-            if not cache or (time.time() * 1000 - cache.ts) > self.cache_ttl_ms:
-                return {"applied": False, "effectiveResponse": None, "reason": "cache_unavailable"}
-            return {
-                "applied": True,
-                "effectiveResponse": {
-                    "status": cache.status,
-                    "headers": cache.headers,
-                    "body": cache.body,
-                    "contentType": cache.content_type,
-                    "modified": "served_stale_cache",
-                    "cacheAgeMs": time.time() * 1000 - cache.ts,
-                },
-            }
+    def _apply_mask(self, input_data: Dict[str, Any], cache: Optional[ResponseCache], profile: Dict[str, Any], now_ms: float) -> Dict[str, Any]:
+        parsed = input_data.get("parsed")
+        if not isinstance(parsed, dict):
+            return {"applied": False, "effectiveResponse": None, "reason": "non-json-response"}
+        masked = _mask_sensitive_fields(parsed)
+        return {
+            "applied": True,
+            "effectiveResponse": {
+                "status": input_data["response_status"],
+                "headers": input_data.get("response_headers") or {},
+                "body": _json.dumps(masked),
+                "contentType": "application/json",
+                "modified": "masked_sensitive_fields",
+            },
+        }
 
-        if action == "reject_response":
-            return {
-                "applied": True,
-                "effectiveResponse": {
-                    "blocked": True,
-                    "reason": "integrity_risk",
-                    "status": 503,
-                },
-            }
+    def _apply_stale(self, input_data: Dict[str, Any], cache: Optional[ResponseCache], profile: Dict[str, Any], now_ms: float) -> Dict[str, Any]:
+        if not cache or (now_ms - cache.ts) > self.cache_ttl_ms:
+            return {"applied": False, "effectiveResponse": None, "reason": "cache_unavailable"}
+        return {
+            "applied": True,
+            "effectiveResponse": {
+                "status": cache.status,
+                "headers": cache.headers,
+                "body": cache.body,
+                "contentType": cache.content_type,
+                "modified": "served_stale_cache",
+                "cacheAgeMs": now_ms - cache.ts,
+            },
+        }
 
-        if action == "downgrade_fidelity":
-            return {
-                "applied": True,
-                "effectiveResponse": {
-                    "status": response_status,
-                    "headers": response_headers,
-                    "body": None,
-                    "bodyHash": _hash_text(response_text or ""),
-                    "bodyBytes": len(response_text.encode("utf-8")) if response_text else 0,
-                    "modified": "metadata_only",
-                },
-            }
+    def _apply_reject(self, input_data: Dict[str, Any], cache: Optional[ResponseCache], profile: Dict[str, Any], now_ms: float) -> Dict[str, Any]:
+        return {
+            "applied": True,
+            "effectiveResponse": {
+                "blocked": True,
+                "reason": "integrity_risk",
+                "status": 503,
+            },
+        }
 
-        if action == "delay_response":
-            return {
-                "applied": True,
-                "effectiveResponse": {
-                    "status": response_status,
-                    "headers": response_headers,
-                    "body": response_text,
-                    "contentType": response_headers.get("content-type"),
-                    "modified": "delayed",
-                    "delayMs": profile["delay_ms"],
-                },
-            }
+    def _apply_downgrade(self, input_data: Dict[str, Any], cache: Optional[ResponseCache], profile: Dict[str, Any], now_ms: float) -> Dict[str, Any]:
+        encoded = (input_data.get("response_text") or "").encode("utf-8")
+        return {
+            "applied": True,
+            "effectiveResponse": {
+                "status": input_data["response_status"],
+                "headers": input_data.get("response_headers") or {},
+                "body": None,
+                # Identity fingerprint only; BLAKE2b is faster than SHA-256 here.
+                "bodyHash": hashlib.blake2b(encoded, digest_size=32).hexdigest(),
+                "hashAlgorithm": "blake2b-256",
+                "bodyBytes": len(encoded),
+                "modified": "metadata_only",
+            },
+        }
 
-        return {"applied": False, "effectiveResponse": None}
+    def _apply_delay(self, input_data: Dict[str, Any], cache: Optional[ResponseCache], profile: Dict[str, Any], now_ms: float) -> Dict[str, Any]:
+        response_headers = input_data.get("response_headers") or {}
+        return {
+            "applied": True,
+            "effectiveResponse": {
+                "status": input_data["response_status"],
+                "headers": response_headers,
+                "body": input_data.get("response_text"),
+                "contentType": response_headers.get("content-type"),
+                "modified": "delayed",
+                "delayMs": profile["delay_ms"],
+            },
+        }
 
-    def _update_cache(self, api_state: DecisionEngineState, response_text: Optional[str], response_headers: Optional[Dict[str, str]], response_status: Optional[int], scores: Dict[str, Any]) -> None:
+    def _update_cache(self, api_state: DecisionEngineState, response_text: Optional[str], response_headers: Optional[Dict[str, str]], response_status: Optional[int], scores: Dict[str, Any], now_ms: float) -> None:
         if not response_text or not response_headers or not response_status:
             return
         if scores["D_score"] < self.config.integrity_threshold:
             return
         api_state.cache = ResponseCache(
-            ts=time.time() * 1000,
+            ts=now_ms,
             status=response_status,
             headers=response_headers,
             body=response_text,
@@ -514,42 +651,41 @@ class DecisionEngine:
     def evaluate(self, observation: Dict[str, Any], response_text: Optional[str], parsed: Any, response_headers: Optional[Dict[str, str]], response_status: Optional[int]) -> Dict[str, Any]:
         # Phase 1 determinism guarantee:
         # Intelligence modules may advise but never override hard rules.
+        now = time.time()
+        now_ms = now * 1000
         api = observation.get("api", "unknown")
         request_url = (observation.get("request") or {}).get("url")
-        endpoint = urlparse(request_url).path if request_url else None
+        endpoint = _url_path(request_url) if request_url else None
         profile = self._get_profile(api, endpoint)
         api_state = self._get_state(api)
 
         signal_summary = self._summarize_signals(observation, profile)
-        entry = {"ts": int(time.time() * 1000), **signal_summary}
-        api_state.window.append(entry)
-        api_state.window = [item for item in api_state.window if item["ts"] >= entry["ts"] - self.window_ms]
+        entry = WindowEntry(int(now_ms), **signal_summary)
+        api_state.add(entry)
+        api_state.expire(entry.ts - self.window_ms)
 
-        aggregates = self._aggregate_window(api_state.window)
+        aggregates = self._aggregate_window(api_state)
         scores = self._compute_scores(aggregates, profile)
-        if self.config.mode == "strict":
+        # Profiles already prefer integrity in strict mode unless a caller
+        # supplied one that does not.
+        if self.config.mode == "strict" and profile["prefer"] != "integrity":
             profile = {**profile, "prefer": "integrity"}
-        decision_choice = self._choose_action(scores, profile)
         if self.config.mode == "passive":
-            decision_choice = {
-                "action": "pass_through",
-                "tradeoff": "none",
-                "justification": "Passive mode: observe only",
-            }
+            decision_choice = _PASSIVE_PASS_THROUGH
+        else:
+            decision_choice = self._choose_action(scores, profile)
 
-        ai_avg = (
-            aggregates["aiAnomalyScoreSum"] / aggregates["aiAnomalyScoreCount"]
-            if aggregates["aiAnomalyScoreCount"]
-            else 0
-        )
-        scores_with_ai = {
-            **scores,
-            "D_score_ai": self._compute_score(scores["integrityRate"] + self.ai_anomaly_weight * ai_avg, profile["integrity_weight"]),
-            "aiAnomalyAvg": ai_avg,
-        }
         ai_used = aggregates["aiAnomalyScoreCount"] > 0
+        if ai_used:
+            ai_avg = aggregates["aiAnomalyScoreSum"] / aggregates["aiAnomalyScoreCount"]
+            d_score_ai = self._compute_score(scores["integrityRate"] + self.ai_anomaly_weight * ai_avg, profile["integrity_weight"])
+        else:
+            # With no AI samples the adjusted score is just D_score.
+            ai_avg = 0
+            d_score_ai = scores["D_score"]
+        scores_with_ai = {**scores, "D_score_ai": d_score_ai, "aiAnomalyAvg": ai_avg}
 
-        self._update_cache(api_state, response_text, response_headers, response_status, scores)
+        self._update_cache(api_state, response_text, response_headers, response_status, scores, now_ms)
 
         applied = self._build_effective_response(
             decision_choice["action"],
@@ -561,13 +697,14 @@ class DecisionEngine:
             },
             api_state.cache,
             profile,
+            now_ms,
         )
 
         decision = {
             "id": observation.get("id"),
             "runId": observation.get("runId"),
             "seq": observation.get("seq"),
-            "ts": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "ts": iso_timestamp(now),
             "api": api,
             "scores": scores,
             "scoresWithAi": scores_with_ai,
@@ -1,116 +1,163 @@
 from __future__ import annotations
 
 import hashlib
-import json
+import re
 import time
 import uuid
-from typing import Any, Dict, Optional, Tuple
-
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional, Pattern, Tuple
+
+from . import _json
+from ._hashing import hash_paths
+from ._clock import iso_timestamp
+from ._sensitive import SENSITIVE_KEY_PATTERNS
 from .config import ApirisConfig
 from .ai.anomaly_model import AnomalyScorer
 
+# Upper bound on the per-API schema and per-request-signature history kept
+# for change detection; least recently updated entries are dropped first.
+_HISTORY_SIZE = 10_000
 
-def _hash_text(text: Optional[str]) -> Optional[str]:
-    if text is None:
-        return None
-    return hashlib.sha256(str(text).encode("utf-8")).hexdigest()
+
+def _fingerprint(data: bytes) -> str:
+    # Fingerprint for schema/response change detection only; a 128-bit
+    # BLAKE2b digest is plenty and cheaper than SHA-256.
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+# Characters a JSON document can start with (N/I for the NaN/Infinity
+# literals stdlib json accepts).
+_JSON_START_CHARS = frozenset('{["tfn-0123456789NI')
 
 
 def _safe_json_parse(text: Optional[str]) -> Optional[Any]:
     if not text or not isinstance(text, str):
         return None
+    # Skip the parser for bodies that cannot be JSON, e.g. HTML error pages.
+    if text[0] not in _JSON_START_CHARS and text.lstrip()[:1] not in _JSON_START_CHARS:
+        return None
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+        return _json.loads(text)
+    except _json.JSONDecodeError:
         return None
 
 
-def _extract_schema_paths(value: Any, prefix: str = "", depth: int = 0, max_depth: int = 3, paths: Optional[set] = None) -> set:
-    if paths is None:
-        paths = set()
-    if depth > max_depth:
-        return paths
-    if isinstance(value, list):
-        array_prefix = f"{prefix}[]" if prefix else "[]"
-        paths.add(array_prefix)
-        if value:
-            _extract_schema_paths(value[0], array_prefix, depth + 1, max_depth, paths)
-        return paths
-    if isinstance(value, dict):
-        for key, val in value.items():
-            next_prefix = f"{prefix}.{key}" if prefix else str(key)
-            paths.add(next_prefix)
-            _extract_schema_paths(val, next_prefix, depth + 1, max_depth, paths)
+def _extract_schema_paths(value: Any, max_depth: int = 3) -> set:
+    """Collect dotted key paths (``[]`` for lists, first element only) down to ``max_depth``."""
+    paths: set = set()
+    stack = [(value, "", 0)]
+    while stack:
+        node, prefix, depth = stack.pop()
+        if isinstance(node, list):
+            array_prefix = prefix + "[]"
+            paths.add(array_prefix)
+            if node and depth < max_depth and isinstance(node[0], (dict, list)):
+                stack.append((node[0], array_prefix, depth + 1))
+        elif isinstance(node, dict):
+            for key, val in node.items():
+                next_prefix = prefix + "." + str(key) if prefix else str(key)
+                paths.add(next_prefix)
+                if depth < max_depth and isinstance(val, (dict, list)):
+                    stack.append((val, next_prefix, depth + 1))
     return paths
 
 
-def _scan_keys_for_matches(value: Any, patterns: list, matches: set, path_prefix: str = "") -> None:
-    if not isinstance(value, (dict, list)):
-        return
-    if isinstance(value, list):
-        for item in value:
-            _scan_keys_for_matches(item, patterns, matches, path_prefix)
-        return
-    for key, val in value.items():
-        next_path = f"{path_prefix}.{key}" if path_prefix else str(key)
-        lower = str(key).lower()
-        for pattern in patterns:
-            if pattern in lower:
-                matches.add(next_path)
-        _scan_keys_for_matches(val, patterns, matches, next_path)
+# Key/body substrings for the two payload detectors, scanned together in one
+# walk; the order here is the order of the result buckets.
+_AUTH_PATTERNS = ("auth", "token", "bearer", "key", "session")
+_KEY_PATTERN_GROUPS = (SENSITIVE_KEY_PATTERNS, _AUTH_PATTERNS)
+# One alternation per group: a key matches the group if any pattern occurs in it.
+_KEY_MATCHERS = tuple(re.compile("|".join(map(re.escape, patterns))) for patterns in _KEY_PATTERN_GROUPS)
+# Each distinct raw-body pattern once, with the buckets it reports into, so
+# patterns shared by both groups are searched for a single time.
+_RAW_PATTERN_BUCKETS = tuple(
+    (pattern, tuple(index for index, patterns in enumerate(_KEY_PATTERN_GROUPS) if pattern in patterns))
+    for pattern in dict.fromkeys(pattern for patterns in _KEY_PATTERN_GROUPS for pattern in patterns)
+)
 
+_VERBOSE_ERROR_PATTERNS = ("exception", "stacktrace", "traceback", "nullreference", "typeerror", "referenceerror", " at ")
+_SENSITIVE_HEADERS = frozenset({"set-cookie", "authorization", "www-authenticate", "x-api-key", "x-auth-token"})
+_CACHE_HEADERS = ("cache-control", "age", "expires", "etag", "last-modified", "cf-cache-status", "x-cache")
 
-def _detect_sensitive_fields(parsed: Any, raw_text: Optional[str]) -> list:
-    patterns = ["password", "secret", "token", "api_key", "api-key", "auth", "cookie", "session", "jwt"]
-    matches: set = set()
-    _scan_keys_for_matches(parsed, patterns, matches)
-    if raw_text:
-        lower = raw_text.lower()
-        for pattern in patterns:
-            if pattern in lower:
-                matches.add(f"raw:{pattern}")
-    return sorted(matches)
+
+@lru_cache(maxsize=4096)
+def _lower(text: str) -> str:
+    # Payload keys and header names repeat across responses.
+    return text.lower()
 
 
-def _detect_auth_hints(parsed: Any, raw_text: Optional[str]) -> list:
-    patterns = ["auth", "token", "bearer", "key", "session"]
-    matches: set = set()
-    _scan_keys_for_matches(parsed, patterns, matches)
+def _scan_keys_multi(value: Any, matchers: Tuple[Pattern[str], ...], matches: Tuple[set, ...], path_prefix: str = "") -> None:
+    """Collect key paths matched by each of ``matchers`` into the parallel ``matches`` set."""
+    searches = tuple((matcher.search, found.add) for matcher, found in zip(matchers, matches))
+    if not isinstance(value, (dict, list)):
+        return
+    lower = _lower
+    stack = [(value, path_prefix)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        node, prefix = pop()
+        if isinstance(node, list):
+            # Reversed so items are visited in document order.
+            push_items = [(item, prefix) for item in node if isinstance(item, (dict, list))]
+            stack.extend(reversed(push_items))
+            continue
+        children = []
+        for key, val in node.items():
+            next_path = f"{prefix}.{key}" if prefix else str(key)
+            lowered = lower(str(key))
+            for search, add in searches:
+                if search(lowered):
+                    add(next_path)
+            if isinstance(val, (dict, list)):
+                children.append((val, next_path))
+        stack.extend(reversed(children))
+
+
+def _detect_payload_exposure(parsed: Any, raw_text: Optional[str]) -> Tuple[list, list]:
+    """Return ``(sensitive_fields, auth_hints)`` from one key walk and one raw-body scan."""
+    matches: Tuple[set, ...] = (set(), set())
+    _scan_keys_multi(parsed, _KEY_MATCHERS, matches)
     if raw_text:
         lower = raw_text.lower()
-        for pattern in patterns:
+        for pattern, buckets in _RAW_PATTERN_BUCKETS:
             if pattern in lower:
-                matches.add(f"raw:{pattern}")
-    return sorted(matches)
+                tag = f"raw:{pattern}"
+                for index in buckets:
+                    matches[index].add(tag)
+    sensitive, auth = matches
+    return sorted(sensitive), sorted(auth)
 
 
 def _detect_verbose_errors(status: Optional[int], body_text: Optional[str]) -> list:
     if not body_text or not status or status < 400:
         return []
-    patterns = ["exception", "stacktrace", "traceback", "nullreference", "typeerror", "referenceerror", " at "]
-    signals = []
     lower = body_text.lower()
-    for pattern in patterns:
-        if pattern in lower:
-            signals.append(pattern)
-    return signals
+    return [pattern for pattern in _VERBOSE_ERROR_PATTERNS if pattern in lower]
 
 
-def _detect_header_exposure(headers: Optional[Dict[str, str]]) -> list:
-    if not headers:
-        return []
-    sensitive = {"set-cookie", "authorization", "www-authenticate", "x-api-key", "x-auth-token"}
-    return [key for key in headers if key.lower() in sensitive]
-
-
-def _get_cache_indicators(headers: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+def _lower_headers(headers: Optional[Mapping[str, Any]]) -> Tuple[Dict[str, Any], list]:
+    """Return ``headers`` keyed by lowercased name plus the sensitive names as sent."""
     if not headers:
+        return {}, []
+    lowered: Dict[str, Any] = {}
+    exposed = []
+    for key, value in headers.items():
+        name = _lower(key)
+        lowered[name] = value
+        if name in _SENSITIVE_HEADERS:
+            exposed.append(key)
+    return lowered, exposed
+
+
+def _get_cache_indicators(lowered_headers: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+    if not lowered_headers:
         return None
     indicators = {}
-    cache_keys = ["cache-control", "age", "expires", "etag", "last-modified", "cf-cache-status", "x-cache"]
-    for key in cache_keys:
-        if key in headers:
-            indicators[key] = headers[key]
+    for key in _CACHE_HEADERS:
+        if key in lowered_headers:
+            indicators[key] = lowered_headers[key]
     return indicators or None
 
 
@@ -139,12 +186,19 @@ def _extract_coingecko_prices(api_name: str, parsed: Any, vs_currency: str) -> O
     return None
 
 
+def _remember(history: OrderedDict, key: str, value: Any) -> None:
+    history[key] = value
+    history.move_to_end(key)
+    if len(history) > _HISTORY_SIZE:
+        history.popitem(last=False)
+
+
 class ObservationEvaluator:
     def __init__(self, config: ApirisConfig, anomaly_scorer: Optional[AnomalyScorer] = None) -> None:
         self.config = config
         self.anomaly_scorer = anomaly_scorer
-        self.schema_by_api: Dict[str, str] = {}
-        self.last_response_by_signature: Dict[str, Dict[str, Any]] = {}
+        self.schema_by_api: "OrderedDict[str, str]" = OrderedDict()
+        self.last_response_by_signature: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self.latest_prices: Dict[str, Dict[str, float]] = {"simple": {}, "markets": {}}
         self.anomaly_runtime: Dict[str, Dict[str, Any]] = {}
 
@@ -159,56 +213,67 @@ class ObservationEvaluator:
         if not other_map:
             return None
 
+        # Stored prices are always floats, so None means "not quoted there".
+        other_get = other_map.get
         inconsistencies = []
         for key, value in price_map.items():
-            if key in other_map:
-                other_value = other_map[key]
-                delta = value - other_value
-                if delta != 0:
-                    inconsistencies.append({"id": key, "current": value, "other": other_value, "delta": delta})
+            other_value = other_get(key)
+            if other_value is None:
+                continue
+            delta = value - other_value
+            if delta != 0:
+                inconsistencies.append({"id": key, "current": value, "other": other_value, "delta": delta})
         return inconsistencies or None
 
     def evaluate(self, api: str, request: Dict[str, Any], response: Dict[str, Any], error: Optional[Dict[str, str]], runtime_context: Dict[str, Any]) -> Dict[str, Any]:
         request_id = uuid.uuid4().hex
-        now_iso = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        now = time.time()
+        now_iso = iso_timestamp(now)
+        now_ms = int(now * 1000)
         response_text = response.get("body") if response else None
         response_headers = response.get("headers") if response else None
         response_status = response.get("status") if response else None
         parsed = _safe_json_parse(response_text)
 
         schema_paths = _extract_schema_paths(parsed) if parsed is not None else set()
-        schema_hash = _hash_text("|".join(sorted(schema_paths))) if schema_paths else None
+        schema_hash = hash_paths(schema_paths) if schema_paths else None
         previous_schema_hash = self.schema_by_api.get(api)
         schema_changed = bool(schema_hash and previous_schema_hash and schema_hash != previous_schema_hash)
         if schema_hash:
-            self.schema_by_api[api] = schema_hash
+            _remember(self.schema_by_api, api, schema_hash)
 
         signature = f"{request.get('method', 'GET')} {request.get('url', '')}"
         previous_response = self.last_response_by_signature.get(signature)
-        response_hash = _hash_text(response_text) if response_text else None
+        # Encoded once for both the fingerprint and the reported byte size.
+        body_bytes = response_text.encode("utf-8") if response_text else b""
+        response_hash = _fingerprint(body_bytes) if response_text else None
         drift_detected = bool(response_hash and previous_response and response_hash != previous_response.get("hash"))
         replayed_payload = bool(response_hash and previous_response and response_hash == previous_response.get("hash"))
 
-        now_ms = int(time.time() * 1000)
-        self.last_response_by_signature[signature] = {
+        _remember(self.last_response_by_signature, signature, {
             "hash": response_hash,
             "ts": now_ms,
             "count": (previous_response.get("count", 0) + 1) if previous_response else 1,
-        }
+        })
 
-        cache_indicators = _get_cache_indicators(response_headers)
-        rate_limited = bool(response_status == 429) or bool(
-            response_headers
-            and (response_headers.get("x-ratelimit-remaining") == "0" or response_headers.get("x-rate-limit-remaining") == "0")
+        # Lowercased once; shared by the cache, rate-limit and exposure checks.
+        lowered_headers, exposed_headers = _lower_headers(response_headers)
+        cache_indicators = _get_cache_indicators(lowered_headers)
+        rate_limited = bool(response_status == 429) or (
+            lowered_headers.get("x-ratelimit-remaining") == "0" or lowered_headers.get("x-rate-limit-remaining") == "0"
         )
         timeout_error = _is_timeout_error(error)
-        soft_timeout_exceeded = runtime_context.get("soft_timeout_ms", 0) > 0 and runtime_context.get("timing_ms", 0) >= runtime_context.get("soft_timeout_ms", 0)
+        context_get = runtime_context.get
+        timing_ms = context_get("timing_ms")
+        soft_timeout_ms = context_get("soft_timeout_ms", 0)
+        soft_timeout_exceeded = soft_timeout_ms > 0 and (0 if timing_ms is None else timing_ms) >= soft_timeout_ms
 
+        sensitive_fields, auth_hints = _detect_payload_exposure(parsed, response_text)
         confidentiality = {
-            "sensitiveFields": _detect_sensitive_fields(parsed, response_text),
-            "authHintsInPayload": _detect_auth_hints(parsed, response_text),
+            "sensitiveFields": sensitive_fields,
+            "authHintsInPayload": auth_hints,
             "verboseErrorSignals": _detect_verbose_errors(response_status, response_text),
-            "headerExposure": _detect_header_exposure(response_headers or {}),
+            "headerExposure": exposed_headers,
         }
 
         integrity = {
@@ -216,16 +281,17 @@ class ObservationEvaluator:
             "previousSchemaHash": previous_schema_hash,
             "schemaChanged": schema_changed,
             "responseHash": response_hash,
+            # Both flags imply previous_response is set.
             "temporalDrift": {
-                "previousHash": previous_response.get("hash") if drift_detected and previous_response else None,
-                "sinceMs": now_ms - previous_response.get("ts") if drift_detected and previous_response else None,
+                "previousHash": previous_response.get("hash"),
+                "sinceMs": now_ms - previous_response.get("ts"),
             } if drift_detected else None,
             "replayedPayload": {
                 "hash": response_hash,
-                "repeatCount": previous_response.get("count") if replayed_payload and previous_response else 1,
-                "sinceMs": now_ms - previous_response.get("ts") if replayed_payload and previous_response else None,
+                "repeatCount": previous_response.get("count"),
+                "sinceMs": now_ms - previous_response.get("ts"),
             } if replayed_payload else None,
-            "crossEndpointInconsistencies": self._build_cross_endpoint_inconsistencies(api, parsed, runtime_context.get("vs_currency", "usd")),
+            "crossEndpointInconsistencies": self._build_cross_endpoint_inconsistencies(api, parsed, context_get("vs_currency", "usd")),
         }
 
         if self.config.enable_ai and self.anomaly_scorer:
@@ -243,8 +309,8 @@ class ObservationEvaluator:
 
         observation = {
             "id": request_id,
-            "runId": runtime_context.get("run_id"),
-            "seq": runtime_context.get("seq"),
+            "runId": context_get("run_id"),
+            "seq": context_get("seq"),
             "ts": now_iso,
             "api": api,
             "mode": self.config.mode,
@@ -258,12 +324,12 @@ class ObservationEvaluator:
             "response": {
                 "status": response_status,
                 "headers": response_headers,
-                "bodyBytes": len(response_text.encode("utf-8")) if response_text else 0,
+                "bodyBytes": len(body_bytes),
                 "contentType": (response_headers or {}).get("content-type"),
             } if response else None,
             "confidentiality": confidentiality,
             "availability": {
-                "latencyMs": runtime_context.get("timing_ms"),
+                "latencyMs": timing_ms,
                 "softTimeoutExceeded": soft_timeout_exceeded or None,
                 "timeoutError": timeout_error,
                 "rateLimited": rate_limited,
@@ -273,8 +339,8 @@ class ObservationEvaluator:
             },
             "integrity": integrity,
             "context": {
-                "intervalMs": runtime_context.get("interval_ms"),
-                "durationMs": runtime_context.get("duration_ms"),
+                "intervalMs": context_get("interval_ms"),
+                "durationMs": context_get("duration_ms"),
             },
         }
 
@@ -3,6 +3,26 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional
 
 
+# (observation key, evidence line) pairs reported when the key is truthy,
+# per observation section, in output order.
+_INTEGRITY_EVIDENCE = (
+    ("schemaChanged", "Schema changed"),
+    ("temporalDrift", "Temporal drift detected"),
+    ("replayedPayload", "Replayed payload detected"),
+    ("crossEndpointInconsistencies", "Cross-endpoint inconsistency detected"),
+)
+_AVAILABILITY_EVIDENCE = (
+    ("rateLimited", "Rate limited"),
+    ("timeoutError", "Timeout error"),
+    ("softTimeoutExceeded", "Soft timeout exceeded"),
+)
+_CONFIDENTIALITY_EVIDENCE = (
+    ("sensitiveFields", "Sensitive fields present"),
+    ("verboseErrorSignals", "Verbose error signals"),
+    ("authHintsInPayload", "Auth hints in payload"),
+)
+
+
 def determine_primary_risk(scores: Dict[str, Any], anomaly: Optional[Dict[str, Any]], prediction: Optional[Dict[str, Any]]) -> str:
     score_entries = [
         {"pillar": "Confidentiality", "value": scores.get("C_score", 1)},
@@ -37,32 +57,16 @@ def build_evidence(scores: Dict[str, Any], observation: Dict[str, Any], predicti
         evidence.append(f"D_score {float(scores.get('D_score', 1)):.2f}")
 
     integrity = observation.get("integrity", {})
-    if integrity.get("schemaChanged"):
-        evidence.append("Schema changed")
-    if integrity.get("temporalDrift"):
-        evidence.append("Temporal drift detected")
-    if integrity.get("replayedPayload"):
-        evidence.append("Replayed payload detected")
-    if integrity.get("crossEndpointInconsistencies"):
-        evidence.append("Cross-endpoint inconsistency detected")
+    evidence.extend(message for key, message in _INTEGRITY_EVIDENCE if integrity.get(key))
 
     availability = observation.get("availability", {})
-    if availability.get("rateLimited"):
-        evidence.append("Rate limited")
-    if availability.get("timeoutError"):
-        evidence.append("Timeout error")
-    if availability.get("softTimeoutExceeded"):
-        evidence.append("Soft timeout exceeded")
-    if availability.get("status") and availability.get("status") >= 500:
-        evidence.append(f"HTTP {availability.get('status')}")
+    evidence.extend(message for key, message in _AVAILABILITY_EVIDENCE if availability.get(key))
+    status = availability.get("status")
+    if status and status >= 500:
+        evidence.append(f"HTTP {status}")
 
     confidentiality = observation.get("confidentiality", {})
-    if confidentiality.get("sensitiveFields"):
-        evidence.append("Sensitive fields present")
-    if confidentiality.get("verboseErrorSignals"):
-        evidence.append("Verbose error signals")
-    if confidentiality.get("authHintsInPayload"):
-        evidence.append("Auth hints in payload")
+    evidence.extend(message for key, message in _CONFIDENTIALITY_EVIDENCE if confidentiality.get(key))
 
     if prediction and prediction.get("probabilities"):
         probs = prediction["probabilities"]
@@ -15,11 +15,46 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
-@dataclass
+# Common vendor patterns, in priority order.
+_VENDOR_PATTERNS: Dict[str, List[str]] = {
+    "openai": ["openai.com", "api.openai"],
+    "anthropic": ["anthropic.com", "claude"],
+    "google": ["google.com", "googleapis.com"],
+    "cohere": ["cohere.ai", "cohere.com"],
+    "huggingface": ["huggingface.co", "hf.co"],
+    "aws": ["amazonaws.com", "aws.amazon"],
+    "azure": ["azure.com", "microsoft.com/azure"],
+    "nvidia": ["nvidia.com", "nvcf"],
+}
+
+_ADVISORY_CACHE_SIZE = 512
+
+# Advisory score weight per CVE severity.
+_SEVERITY_WEIGHTS = {
+    "CRITICAL": 1.0,
+    "HIGH": 0.7,
+    "MEDIUM": 0.4,
+    "LOW": 0.1,
+}
+
+
+@lru_cache(maxsize=2048)
+def _vendor_for_url(url: str) -> Optional[str]:
+    # Checked vendor by vendor: patterns can overlap (``hf.co`` inside
+    # ``hf.cohere.com``), and the earlier vendor must win.
+    url_lower = url.lower()
+    for vendor, patterns in _VENDOR_PATTERNS.items():
+        if any(pattern in url_lower for pattern in patterns):
+            return vendor
+    return None
+
+
+@dataclass(slots=True, frozen=True)
 class CVEEntry:
     """Represents a single CVE entry"""
     id: str
@@ -31,7 +66,7 @@ class CVEEntry:
     references: List[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CVEAdvisory:
     """Advisory CVE information for a vendor/service"""
     vendor: str
@@ -59,6 +94,13 @@ class CVEAdvisorySystem:
         """
         self.cve_data: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
         self.enabled = False
+        # Advisories are pure functions of the loaded data, so they are
+        # memoized per (vendor, service) until the data is reloaded.
+        self._advisory_cache: Dict[Tuple[str, Optional[str]], Optional[CVEAdvisory]] = {}
+        self._vendor_keys: Tuple[str, ...] = ()
+        self._vendor_rank: Dict[str, int] = {}
+        self._vendor_substrings: Dict[str, int] = {}
+        self._max_vendor_key_len = 0
         
         # Default to package data location if no path provided
         if cve_data_path is None:
@@ -69,6 +111,7 @@ class CVEAdvisorySystem:
     
     def _load_cve_data(self, path: str) -> None:
         """Load CVE data from local JSON file."""
+        self._advisory_cache.clear()
         try:
             cve_path = Path(path)
             if not cve_path.exists():
@@ -78,11 +121,40 @@ class CVEAdvisorySystem:
             with open(cve_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
                 self.cve_data = data.get("vendors", {})
+                self._index_vendor_keys()
                 self.enabled = True
         except Exception:
             # Never fail - CVE is advisory only
             self.enabled = False
     
+    def _index_vendor_keys(self) -> None:
+        """Index vendor keys for the fuzzy fallback in ``get_advisory``.
+
+        Maps every substring of every key to the position of the first key
+        containing it, so "vendor is part of a key" is one dict lookup.
+        """
+        self._vendor_keys = tuple(self.cve_data)
+        self._vendor_rank = {key: rank for rank, key in reversed(list(enumerate(self._vendor_keys)))}
+        substrings: Dict[str, int] = {}
+        for rank, key in enumerate(self._vendor_keys):
+            for start in range(len(key) + 1):
+                for end in range(start, len(key) + 1):
+                    substrings.setdefault(key[start:end], rank)
+        self._vendor_substrings = substrings
+        self._max_vendor_key_len = max(map(len, self._vendor_keys), default=0)
+    
+    def _match_vendor_key(self, vendor_key: str) -> Optional[str]:
+        """Return the first key that contains ``vendor_key`` or is contained in it."""
+        best = self._vendor_substrings.get(vendor_key)
+        rank = self._vendor_rank
+        max_len = self._max_vendor_key_len
+        for start in range(len(vendor_key) + 1):
+            for end in range(start, min(len(vendor_key), start + max_len) + 1):
+                found = rank.get(vendor_key[start:end])
+                if found is not None and (best is None or found < best):
+                    best = found
+        return self._vendor_keys[best] if best is not None else None
+    
     def _compute_advisory_score(self, cve_entries: List[CVEEntry]) -> float:
         """
         Compute an advisory severity score from CVE entries.
@@ -92,15 +164,7 @@ class CVEAdvisorySystem:
         if not cve_entries:
             return 0.0
         
-        # Weight by severity
-        severity_weights = {
-            "CRITICAL": 1.0,
-            "HIGH": 0.7,
-            "MEDIUM": 0.4,
-            "LOW": 0.1
-        }
-        
-        total_weight = sum(severity_weights.get(cve.severity, 0.0) for cve in cve_entries)
+        total_weight = sum(_SEVERITY_WEIGHTS.get(cve.severity, 0.0) for cve in cve_entries)
         max_weight = len(cve_entries) * 1.0  # Max if all were CRITICAL
         
         return min(1.0, total_weight / max_weight) if max_weight > 0 else 0.0
@@ -134,6 +198,17 @@ class CVEAdvisorySystem:
         if not self.enabled:
             return None
         
+        key = (vendor, service)
+        if key in self._advisory_cache:
+            return self._advisory_cache[key]
+        advisory = self._build_advisory(vendor, service)
+        if len(self._advisory_cache) >= _ADVISORY_CACHE_SIZE:
+            self._advisory_cache.clear()
+        self._advisory_cache[key] = advisory
+        return advisory
+    
+    def _build_advisory(self, vendor: str, service: Optional[str]) -> Optional[CVEAdvisory]:
+        """Build the advisory for ``get_advisory`` from the loaded CVE data."""
         # Normalize vendor name
         vendor_key = vendor.lower().replace("-", "").replace("_", "")
         
@@ -141,10 +216,9 @@ class CVEAdvisorySystem:
         vendor_data = self.cve_data.get(vendor_key)
         if not vendor_data:
             # Try substring match
-            for key in self.cve_data:
-                if vendor_key in key or key in vendor_key:
-                    vendor_data = self.cve_data[key]
-                    break
+            key = self._match_vendor_key(vendor_key)
+            if key is not None:
+                vendor_data = self.cve_data[key]
         
         if not vendor_data:
             return None
@@ -202,22 +276,4 @@ class CVEAdvisorySystem:
         Returns:
             Vendor name if identifiable, None otherwise
         """
-        url_lower = url.lower()
-        
-        # Common vendor patterns
-        vendor_patterns = {
-            "openai": ["openai.com", "api.openai"],
-            "anthropic": ["anthropic.com", "claude"],
-            "google": ["google.com", "googleapis.com"],
-            "cohere": ["cohere.ai", "cohere.com"],
-            "huggingface": ["huggingface.co", "hf.co"],
-            "aws": ["amazonaws.com", "aws.amazon"],
-            "azure": ["azure.com", "microsoft.com/azure"],
-            "nvidia": ["nvidia.com", "nvcf"],
-        }
-        
-        for vendor, patterns in vendor_patterns.items():
-            if any(pattern in url_lower for pattern in patterns):
-                return vendor
-        
-        return None
+        return _vendor_for_url(url)
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
 import hashlib
-import json
+import time
 from typing import Any, Dict, Optional
 
+from . import _json
+from ._sensitive import SENSITIVE_KEY_RE
 from .cache import ResponseCache
 
+# Rejections always carry the same body.
+_REJECT_BODY = _json.dumps({"error": "integrity_risk"})
 
-def _hash_text(text: Optional[str]) -> Optional[str]:
-    if text is None:
-        return None
-    return hashlib.sha256(str(text).encode("utf-8")).hexdigest()
+
+def _may_contain_sensitive_keys(text: Optional[str]) -> bool:
+    # The key pattern also runs over the raw body: a miss there means no key
+    # can need masking, unless the body hides key text behind \uXXXX escapes.
+    if not text or "\\u" in text:
+        return True
+    return SENSITIVE_KEY_RE.search(text) is not None
 
 
 def _mask_sensitive_fields(value: Any, depth: int = 0, max_depth: int = 6) -> Any:
@@ -21,10 +28,10 @@ def _mask_sensitive_fields(value: Any, depth: int = 0, max_depth: int = 6) -> An
     if not isinstance(value, dict):
         return value
 
-    patterns = ["password", "secret", "token", "api_key", "api-key", "auth", "cookie", "session", "jwt"]
+    search = SENSITIVE_KEY_RE.search
     result: Dict[str, Any] = {}
     for key, val in value.items():
-        if any(pattern in str(key).lower() for pattern in patterns):
+        if search(key if isinstance(key, str) else str(key)):
             result[key] = "[MASKED]"
         else:
             result[key] = _mask_sensitive_fields(val, depth + 1, max_depth)
@@ -44,11 +51,19 @@ class ResponseInterceptor:
             }
 
         if action == "mask_sensitive_fields":
+            if isinstance(parsed, dict) and not _may_contain_sensitive_keys(response_text):
+                return {
+                    "status": response_status,
+                    "headers": response_headers,
+                    "body": response_text,
+                    "modified": False,
+                    "modification": "mask_skipped_no_sensitive_keys",
+                }
             if isinstance(parsed, dict):
                 return {
                     "status": response_status,
                     "headers": response_headers,
-                    "body": json.dumps(_mask_sensitive_fields(parsed)),
+                    "body": _json.dumps(_mask_sensitive_fields(parsed)),
                     "modified": True,
                     "modification": "masked_sensitive_fields",
                 }
@@ -70,7 +85,7 @@ class ResponseInterceptor:
                     "modification": "cache_unavailable_pass_through",
                     "actionApplied": "pass_through",
                 }
-            cache_age_ms = int((__import__("time").time() * 1000) - cache.ts)
+            cache_age_ms = int(time.time() * 1000 - cache.ts)
             if cache_age_ms > cache_ttl_ms:
                 return {
                     "status": response_status,
@@ -94,20 +109,22 @@ class ResponseInterceptor:
             return {
                 "status": 503,
                 "headers": {"content-type": "application/json"},
-                "body": json.dumps({"error": "integrity_risk"}),
+                "body": _REJECT_BODY,
                 "modified": True,
                 "modification": "rejected",
                 "actionApplied": "reject_response",
             }
 
         if action == "downgrade_fidelity":
+            encoded = response_text.encode("utf-8") if response_text else b""
             return {
                 "status": response_status,
                 "headers": {"content-type": "application/json"},
-                "body": json.dumps(
+                "body": _json.dumps(
                     {
-                        "bodyHash": _hash_text(response_text) if response_text else None,
-                        "bodyBytes": len(response_text.encode("utf-8")) if response_text else 0,
+                        "bodyHash": hashlib.blake2b(encoded, digest_size=32).hexdigest() if response_text else None,
+                        "hashAlgorithm": "blake2b-256",
+                        "bodyBytes": len(encoded),
                         "status": response_status,
                     }
                 ),
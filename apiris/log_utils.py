@@ -1,8 +1,13 @@
 from __future__ import annotations
 
-import json
+import os
+import threading
+import time
+import weakref
 from pathlib import Path
-from typing import Any, Iterable, List
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from . import _json
 
 
 def ensure_dir(file_path: str | Path) -> Path:
@@ -11,27 +16,110 @@ def ensure_dir(file_path: str | Path) -> Path:
     return path
 
 
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+# Seconds between checks of whether the log path still names the open file.
+_ROTATION_CHECK_INTERVAL = 1.0
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+class JsonlAppender:
+    """Append JSON lines to one file through a descriptor kept open between writes.
+
+    Writes are unbuffered ``O_APPEND`` writes, so readers see each record
+    immediately. Rotation and deletion are detected lazily: the path is
+    checked at most once per second, so records written in between still
+    go to the old file. The descriptor is closed by ``close()`` or when the
+    appender is garbage collected. Writes are safe to share between threads.
+    """
+
+    def __init__(self, file_path: str | Path) -> None:
+        self.path = Path(file_path)
+        self._fd: Optional[int] = None
+        self._inode: Optional[Tuple[int, int]] = None
+        self._finalizer: Optional[weakref.finalize] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def write(self, payload: dict) -> bool:
+        try:
+            line = _json.dumps_bytes(payload) + b"\n"
+        except ValueError:
+            return False
+        return self.write_line(line)
+
+    def write_line(self, line: bytes) -> bool:
+        """Append an already serialized, newline-terminated record."""
+        # Held across the write so a rotation reopen in another thread
+        # cannot close the descriptor mid-write.
+        with self._lock:
+            try:
+                _write_all(self._current_fd(), line)
+                return True
+            except OSError:
+                return False
+
+    def _current_fd(self) -> int:
+        if self._fd is not None:
+            now = time.monotonic()
+            if now - self._checked_at < _ROTATION_CHECK_INTERVAL:
+                return self._fd
+            self._checked_at = now
+            try:
+                stat = os.stat(self.path)
+                current = (stat.st_dev, stat.st_ino)
+            except FileNotFoundError:
+                current = None
+            if current == self._inode:
+                return self._fd
+            self._close()
+        fd = os.open(ensure_dir(self.path), _APPEND_FLAGS, 0o644)
+        stat = os.fstat(fd)
+        self._checked_at = time.monotonic()
+        self._fd = fd
+        self._inode = (stat.st_dev, stat.st_ino)
+        self._finalizer = weakref.finalize(self, os.close, fd)
+        return fd
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._fd = None
+        self._inode = None
+
+
 def append_jsonl(file_path: str | Path, payload: dict) -> bool:
+    appender = JsonlAppender(file_path)
     try:
-        path = ensure_dir(file_path)
-        with path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload) + "\n")
-        return True
-    except (OSError, ValueError):
-        return False
+        return appender.write(payload)
+    finally:
+        appender.close()
 
 
-def read_jsonl(file_path: str | Path) -> List[dict]:
+def iter_jsonl(file_path: str | Path) -> Iterator[dict]:
+    """Yield records one line at a time, skipping blank and malformed lines."""
     path = Path(file_path)
     if not path.exists():
-        return []
-    content = path.read_text(encoding="utf-8").strip()
-    if not content:
-        return []
-    records: List[dict] = []
-    for line in content.splitlines():
-        try:
-            records.append(json.loads(line))
-        except json.JSONDecodeError:
-            continue
-    return records
+        return
+    with path.open("rb") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield _json.loads(line)
+            except (_json.JSONDecodeError, UnicodeDecodeError):
+                continue
+
+
+def read_jsonl(file_path: str | Path) -> List[dict]:
+    return list(iter_jsonl(file_path))
@@ -8,6 +8,9 @@ import yaml
 
 from .policy_validator import PolicyValidator
 
+# libyaml-backed when available; same safe semantics as yaml.safe_load.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class PolicyLoader:
     def __init__(self, validator: PolicyValidator | None = None) -> None:
@@ -18,7 +21,7 @@ class PolicyLoader:
         if not policy_path.exists():
             return {}
         if policy_path.suffix.lower() in {".yaml", ".yml"}:
-            raw = yaml.safe_load(policy_path.read_text(encoding="utf-8")) or {}
+            raw = yaml.load(policy_path.read_text(encoding="utf-8"), Loader=_YAML_LOADER) or {}
         else:
             raw = json.loads(policy_path.read_text(encoding="utf-8"))
 
@@ -1,7 +1,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+# Policy keys copied onto a decision profile; names match on both sides.
+_PROFILE_KEYS = (
+    "confidentiality_threshold",
+    "availability_threshold",
+    "integrity_threshold",
+    "confidentiality_weight",
+    "availability_weight",
+    "integrity_weight",
+    "latency_budget_ms",
+    "delay_ms",
+    "prefer",
+)
 
 
 @dataclass(frozen=True)
@@ -10,38 +23,68 @@ class EffectivePolicy:
 
 
 class PolicyManager:
+    """Resolves global, service and endpoint policy scopes.
+
+    Merged scopes are cached per policy, so changes must be made by
+    assigning a new dict to ``policy``; editing the current one in place
+    is not seen by later lookups.
+    """
+
     def __init__(self, policy: Optional[Dict[str, Any]] = None) -> None:
+        self._version = 0
+        self._effective_cache: Dict[Tuple[str, Optional[str]], EffectivePolicy] = {}
         self.policy = policy or {"global": {}, "services": {}, "endpoints": {}}
 
+    @property
+    def policy(self) -> Dict[str, Any]:
+        """The active policy. Replace it, rather than editing it in place, so cached lookups see the change."""
+        return self._policy
+
+    @policy.setter
+    def policy(self, policy: Dict[str, Any]) -> None:
+        self._policy = policy
+        self._version += 1
+        self._effective_cache = {}
+
+    def version(self) -> int:
+        """Counter bumped whenever ``policy`` is replaced; lets callers invalidate derived caches."""
+        return self._version
+
     def get_effective_policy(self, service_name: str, endpoint: Optional[str] = None) -> EffectivePolicy:
-        merged: Dict[str, Any] = {}
-        merged.update(self.policy.get("global") or {})
-        merged.update((self.policy.get("services") or {}).get(service_name, {}))
-        if endpoint:
-            merged.update(((self.policy.get("endpoints") or {}).get(service_name, {}) or {}).get(endpoint, {}))
-        return EffectivePolicy(values=merged)
+        """Merge global, service and endpoint scopes; results are cached until ``policy`` is replaced.
+
+        The returned ``values`` dict is shared between callers and must not be mutated.
+        """
+        policy = self.policy
+        services = policy.get("services") or {}
+        service_endpoints = (policy.get("endpoints") or {}).get(service_name, {}) or {}
+        endpoint_policy = service_endpoints.get(endpoint) if endpoint else None
+        # Services and endpoints without their own scope share one entry, so
+        # arbitrary request paths (``/users/<id>``) don't grow the cache.
+        key = (
+            service_name if service_name in services or service_endpoints else None,
+            endpoint if endpoint_policy is not None else None,
+        )
+        effective = self._effective_cache.get(key)
+        if effective is None:
+            merged: Dict[str, Any] = {}
+            merged.update(policy.get("global") or {})
+            merged.update(services.get(service_name, {}))
+            if endpoint_policy is not None:
+                merged.update(endpoint_policy)
+            effective = self._effective_cache[key] = EffectivePolicy(values=merged)
+        return effective
 
     def apply_to_profile(self, profile: Dict[str, Any], service_name: str, endpoint: Optional[str] = None) -> Dict[str, Any]:
         effective = self.get_effective_policy(service_name, endpoint).values
         if not effective:
             return profile
 
-        allowed_keys = {
-            "confidentiality_threshold": "confidentiality_threshold",
-            "availability_threshold": "availability_threshold",
-            "integrity_threshold": "integrity_threshold",
-            "confidentiality_weight": "confidentiality_weight",
-            "availability_weight": "availability_weight",
-            "integrity_weight": "integrity_weight",
-            "latency_budget_ms": "latency_budget_ms",
-            "delay_ms": "delay_ms",
-            "prefer": "prefer",
-        }
-
         updated = profile.copy()
-        for key, target in allowed_keys.items():
-            if key in effective and effective[key] is not None:
-                updated[target] = effective[key]
+        for key in _PROFILE_KEYS:
+            value = effective.get(key)
+            if value is not None:
+                updated[key] = value
 
         if effective.get("force_integrity_priority") is True:
             updated["prefer"] = "integrity"
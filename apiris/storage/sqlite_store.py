@@ -1,23 +1,44 @@
 from __future__ import annotations
 
-import json
 import sqlite3
+import threading
 import time
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 
+from .. import _json
 from ..intelligence.models import ServiceProfile, VendorProfile
 
+# (service_name, timestamp, c_score, a_score, d_score, latency_ms, schema_changed, decision_action)
+TimeSeriesRow = Tuple[str, str, float, float, float, Optional[int], Optional[bool], Optional[str]]
+
 
 class SQLiteStore:
     def __init__(self, db_path: str) -> None:
         self.db_path = db_path
+        self._local = threading.local()
         self._ensure_schema()
 
     def _connect(self) -> sqlite3.Connection:
-        path = Path(self.db_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        return sqlite3.connect(self.db_path)
+        # One connection per thread, reused across calls; ``with conn:`` still
+        # scopes each write to its own transaction.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            path = Path(self.db_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Close the calling thread's connection, if one is open."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
 
     def _ensure_schema(self) -> None:
         with self._connect() as conn:
@@ -64,6 +85,12 @@ class SQLiteStore:
                 )
                 """
             )
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_cad_ts_service_ts
+                ON cad_time_series (service_name, timestamp)
+                """
+            )
             cursor.execute(
                 """
                 CREATE TABLE IF NOT EXISTS policy_versions (
@@ -239,49 +266,58 @@ class SQLiteStore:
         schema_changed: Optional[bool],
         decision_action: Optional[str],
     ) -> None:
+        self.insert_time_series_many(
+            [(service_name, timestamp, c_score, a_score, d_score, latency_ms, schema_changed, decision_action)]
+        )
+
+    def insert_time_series_many(self, rows: Iterable[TimeSeriesRow]) -> None:
+        """Insert ``insert_time_series`` argument tuples in a single transaction."""
         try:
             with self._connect() as conn:
-                conn.execute(
+                conn.executemany(
                     """
                     INSERT INTO cad_time_series (
                         service_name, timestamp, c_score, a_score, d_score,
                         latency_ms, schema_changed, decision_action
                     ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                     """,
-                    (
-                        service_name,
-                        timestamp,
-                        c_score,
-                        a_score,
-                        d_score,
-                        latency_ms,
-                        int(schema_changed) if schema_changed is not None else None,
-                        decision_action,
-                    ),
+                    [
+                        (*row[:6], int(row[6]) if row[6] is not None else None, row[7])
+                        for row in rows
+                    ],
                 )
                 conn.commit()
         except Exception:
             pass
 
-    def list_time_series(self, service_name: Optional[str] = None) -> List[dict]:
+    def list_time_series(
+        self,
+        service_name: Optional[str] = None,
+        since: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        """Return stored rows in insertion order, optionally from ``since`` onwards and capped at ``limit``."""
+        clauses = []
+        params: list = []
+        if service_name:
+            clauses.append("service_name = ?")
+            params.append(service_name)
+        if since:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        query = """
+            SELECT service_name, timestamp, c_score, a_score, d_score,
+                   latency_ms, schema_changed, decision_action
+            FROM cad_time_series
+            """
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY id"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
         with self._connect() as conn:
-            if service_name:
-                rows = conn.execute(
-                    """
-                    SELECT service_name, timestamp, c_score, a_score, d_score,
-                           latency_ms, schema_changed, decision_action
-                    FROM cad_time_series WHERE service_name = ?
-                    """,
-                    (service_name,),
-                ).fetchall()
-            else:
-                rows = conn.execute(
-                    """
-                    SELECT service_name, timestamp, c_score, a_score, d_score,
-                           latency_ms, schema_changed, decision_action
-                    FROM cad_time_series
-                    """
-                ).fetchall()
+            rows = conn.execute(query, params).fetchall()
         return [
             {
                 "service_name": row[0],
@@ -306,7 +342,7 @@ class SQLiteStore:
                     """,
                     (
                         version,
-                        json.dumps(policy),
+                        _json.dumps(policy),
                         time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
                     ),
                 )
@@ -326,8 +362,8 @@ class SQLiteStore:
         result = []
         for row in rows:
             try:
-                policy = json.loads(row[1]) if row[1] else {}
-            except json.JSONDecodeError:
+                policy = _json.loads(row[1]) if row[1] else {}
+            except _json.JSONDecodeError:
                 policy = {}
             result.append({"version": row[0], "policy": policy, "created_at": row[2]})
         return result
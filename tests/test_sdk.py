@@ -4,6 +4,11 @@ from pathlib import Path
 import responses
 
 from apiris import ApirisClient
+from apiris.config import ApirisConfig
+from apiris.decision_engine import DecisionEngine, DecisionEngineState, WindowEntry, _mask_sensitive_fields
+from apiris.intelligence.cve_advisory import CVEAdvisorySystem
+from apiris.interceptor import ResponseInterceptor
+from apiris.policy.policy_manager import PolicyManager
 
 
 NASA_URL = "https://api.nasa.gov/planetary/apod?api_key=Y8J2mcPKdhjVjUSSYdSGkjuXkaAouZrd6mIE6yYC"
@@ -113,6 +118,92 @@ def test_ai_disabled_mode(tmp_path: Path):
     assert not anomalies_path.exists()
 
 
+@responses.activate
+def test_get_many_preserves_order(tmp_path: Path):
+    config_path = write_config(tmp_path, enable_ai=False)
+    responses.add(responses.GET, NASA_URL, json={"status": "ok"}, status=200)
+    responses.add(responses.GET, STRICT_URL, json={"ok": True}, status=200)
+
+    with ApirisClient(config_path=str(config_path)) as client:
+        results = client.get_many([NASA_URL, STRICT_URL])
+
+    assert [result.data for result in results] == [{"status": "ok"}, {"ok": True}]
+
+    log_path = Path(tmp_path / "runtime" / "logs" / "cad_observations.jsonl")
+    entries = read_jsonl(log_path)
+    assert [entry["api"] for entry in entries] == ["api.nasa.gov", "strict-mode-api"]
+
+
+def test_cve_vendor_priority_with_overlapping_patterns():
+    cve_system = CVEAdvisorySystem()
+    # "hf.co" (huggingface) overlaps "cohere.com"/"cohere.ai"; cohere is listed first.
+    assert cve_system.extract_vendor_from_url("https://hf.cohere.com") == "cohere"
+    assert cve_system.extract_vendor_from_url("https://api.hf.cohere.ai/v1") == "cohere"
+    assert cve_system.extract_vendor_from_url("https://hf.co/models") == "huggingface"
+
+
+def test_mask_sensitive_fields_copies_only_the_masked_path():
+    untouched = {"items": [{"id": 1}], "meta": {"page": 2}}
+    payload = {"user": {"name": "ada", "password": "hunter2"}, "data": untouched}
+
+    masked = _mask_sensitive_fields(payload)
+
+    assert masked["user"] == {"name": "ada", "password": "[MASKED]"}
+    assert masked["data"] is untouched
+    assert payload["user"]["password"] == "hunter2"
+
+
+def test_mask_skipped_when_body_has_no_sensitive_keys():
+    body = json.dumps({"status": "ok", "items": [{"id": 1}]})
+
+    result = ResponseInterceptor().apply("mask_sensitive_fields", body, json.loads(body), {}, 200, None, 0)
+
+    assert result["body"] is body
+    assert result["modified"] is False
+    assert result["modification"] == "mask_skipped_no_sensitive_keys"
+
+
+def test_mask_applies_to_unicode_escaped_keys():
+    body = '{"\\u0074oken": "abc", "ok": true}'
+
+    result = ResponseInterceptor().apply("mask_sensitive_fields", body, json.loads(body), {}, 200, None, 0)
+
+    assert result["modified"] is True
+    assert json.loads(result["body"]) == {"token": "[MASKED]", "ok": True}
+
+
+def test_decision_window_running_sums_match_recomputed_totals():
+    state = DecisionEngineState()
+    for ts in range(20):
+        state.add(WindowEntry(ts, ts % 2, ts % 3, 1, 0.5 if ts % 4 == 0 else 0.0))
+        state.expire(ts - 5)
+
+        window = list(state.window)
+        scored = [entry.aiAnomalyScore for entry in window if entry.aiAnomalyScore > 0]
+        assert [entry.ts for entry in window] == list(range(max(0, ts - 5), ts + 1))
+        assert state.confidentiality_sum == sum(entry.confidentialitySignals for entry in window)
+        assert state.availability_sum == sum(entry.availabilitySignals for entry in window)
+        assert state.integrity_sum == sum(entry.integritySignals for entry in window)
+        assert state.ai_score_count == len(scored)
+        assert state.ai_score_sum == sum(scored)
+
+
+def test_profile_cache_invalidated_when_profiles_or_policy_replaced():
+    config = ApirisConfig(integrity_threshold=0.5, availability_threshold=0.6, enable_ai=False)
+    engine = DecisionEngine(config, profiles={"svc1": {"integrity_threshold": 0.3}})
+    assert engine._get_profile("svc1")["integrity_threshold"] == 0.3
+
+    engine.profiles = {"svc1": {"integrity_threshold": 0.2}}
+    assert engine._get_profile("svc1")["integrity_threshold"] == 0.2
+
+    engine.policy_manager = PolicyManager({"global": {"availability_threshold": 0.1}})
+    assert engine._get_profile("svc1")["availability_threshold"] == 0.1
+
+    engine.policy_manager.policy = {"global": {"availability_threshold": 0.05}}
+    assert engine._get_profile("svc1")["availability_threshold"] == 0.05
+    assert engine._get_profile("svc1")["integrity_threshold"] == 0.2
+
+
 @responses.activate
 def test_logging_integrity(tmp_path: Path):
     repo_root = Path(__file__).resolve().parents[1]
@@ -0,0 +1,24 @@
+from pathlib import Path
+
+import pytest
+
+# apiris.storage.sqlite_store imports apiris.intelligence.models, which is
+# not part of this tree yet; skip rather than fail collection until it is.
+sqlite_store = pytest.importorskip("apiris.storage.sqlite_store")
+
+
+def test_sqlite_time_series_batch_insert(tmp_path: Path) -> None:
+    store = sqlite_store.SQLiteStore(str(tmp_path / "Apiris.db"))
+    store.insert_time_series("svc1", "2026-01-01T00:00:00Z", 0.1, 0.2, 0.3, 120, False, "pass_through")
+    store.insert_time_series_many(
+        [
+            ("svc1", "2026-01-01T00:00:01Z", 0.4, 0.5, 0.6, None, True, "reject_response"),
+            ("svc2", "2026-01-01T00:00:02Z", 0.7, 0.8, 0.9, 80, None, None),
+        ]
+    )
+    rows = store.list_time_series("svc1")
+    assert [row["timestamp"] for row in rows] == ["2026-01-01T00:00:00Z", "2026-01-01T00:00:01Z"]
+    assert rows[1]["schema_changed"] is True
+    assert len(store.list_time_series()) == 3
+    assert [row["timestamp"] for row in store.list_time_series("svc1", since="2026-01-01T00:00:01Z")] == ["2026-01-01T00:00:01Z"]
+    assert [row["service_name"] for row in store.list_time_series(limit=1)] == ["svc1"]